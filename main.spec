@@ -4,12 +4,15 @@ from PyInstaller.utils.hooks import collect_data_files
 
 project_root = os.path.abspath('src')
 pvlib_datas = collect_data_files('pvlib', include_py_files=False)
+# Leaflet (von setup.py build_exe nach src/resources/leaflet geladen)
+leaflet_datas = [('src\\resources\\leaflet', 'leaflet')] \
+    if os.path.isdir(os.path.join('src', 'resources', 'leaflet')) else []
 
 a = Analysis(
     ['src\\main.py'],
     pathex=[project_root],
     binaries=[],
-    datas=pvlib_datas + [
+    datas=pvlib_datas + leaflet_datas + [
         ('src\\resources\\batteries.json',  'resources'),
         ('src\\resources\\inverters.json',  'resources'),
         ('src\\resources\\pv_systems.json', 'resources'),
@@ -17,14 +20,17 @@ a = Analysis(
         ('src\\ui\\pv_generator_page.ui',   'ui'),
         ('src\\icons\\icon.ico',            'icons'),
         ('src\\icons\\splash.png',          'icons'),
+        ('src\\resources\\map.html',        '.'),
     ],
     hiddenimports=[
         'gui.mainwindow',
         'gui.ui_main_window',
+        'gui.ui_pv_generator_page',
         'gui.widgets',
         'logic.calculation',
         'worker.calcworker',
         'bkwsimx.version',
+        'resources',
         'cx_Freeze',
         'cx_Logging',
     ],
@@ -1,110 +1,304 @@
-# setup.py
-import sys
-import os
-from cx_Freeze import setup, Executable
-from src.bkwsimx import __version__
-
-# ---------------------------------------------------------------------------
-# Build-Optionen für cx_Freeze
-# ---------------------------------------------------------------------------
-build_exe_options = {
-    "include_path": [os.path.join(os.getcwd(), "src")],
-    "packages": ["gui", "logic", "worker"],
-    "includes": [
-        "gui.mainwindow",
-        "gui.ui_main_window",
-        "gui.widgets",
-        "logic.calculation",
-        "worker.calcworker",
-        "bkwsimx.version",
-    ],
-    "excludes": [
-        "tkinter", "PyQt4", "PyQt5", "PySide2", "PySide6",
-        "IPython", "pytest", "sphinx", "Cython", "numba",
-        "cupy", "dask", "torch", "jax", "sympy", "statsmodels",
-        "tables", "boto3", "botocore",
-        "gi", "cairo", "cairocffi", "wx",
-        "openpyxl", "lxml", "bs4", "docutils", "yaml",
-        "pandas.tests",
-        "matplotlib.tests",
-        "matplotlib.sphinxext",
-    ],
-    "include_files": [
-        ("src/resources/batteries.json",    "lib/resources/batteries.json"),
-        ("src/resources/inverters.json",    "lib/resources/inverters.json"),
-        ("src/resources/pv_systems.json",   "lib/resources/pv_systems.json"),
-        ("src/ui/main_window.ui",           "lib/ui/main_window.ui"),
-        ("src/ui/pv_generator_page.ui",     "lib/ui/pv_generator_page.ui"),
-        ("src/icons/icon.ico",              "lib/icons/icon.ico"),
-        ("src/icons/splash.png",            "lib/icons/splash.png"),
-    ],
-    "include_msvcr": True,
-}
-
-# ---------------------------------------------------------------------------
-# Executables definieren (mit korrekten Shortcut-Parametern)
-# ---------------------------------------------------------------------------
-base = "Win32GUI" if sys.platform == "win32" else None
-
-executables = [
-    Executable(
-        script="src/main.py",
-        base=base,
-        target_name="BKWSimX.exe",
-        icon="src/icons/icon.ico",
-        shortcut_name="BKWSimX",            # Startmenü-Shortcut 
-        shortcut_dir="ProgramMenuFolder",    # 
-    ),
-    Executable(
-        script="src/launch_debug.py",
-        base=None,
-        target_name="BKWSimX_debug.exe",
-        icon="src/icons/icon.ico",
-        shortcut_name="BKWSimX Debug",
-        shortcut_dir="ProgramMenuFolder",
-    ),
-]
-
-# ---------------------------------------------------------------------------
-# MSI-Optionen: Upgrade, Pfad, Lizenz & Shortcuts über data
-# ---------------------------------------------------------------------------
-bdist_msi_options = {
-    "all_users": True,  # Installation für alle Benutzer :contentReference[oaicite:2]{index=2}
-    "add_to_path": False,  # nicht automatisch in PATH :contentReference[oaicite:3]{index=3}
-    # 64-Bit-Standardpfad – für 32-Bit käme [ProgramFilesFolder]
-    "initial_target_dir": r"[ProgramFiles64Folder]\BKWSimX",  # :contentReference[oaicite:4]{index=4}
-    # Upgrade-Code (gleich lassen für sauberen Versionswechsel)
-    "upgrade_code": "{12345678-90AB-CDEF-1234-567890ABCDEF}",  # :contentReference[oaicite:5]{index=5}
-    # Lizenz-Dialog (RTF)
-    "license_file": os.path.join("src", "LICENSE.rtf"),      # :contentReference[oaicite:6]{index=6}
-    # MSI-Tabelle „Shortcut“: Desktop-Verknüpfung
-    "data": {
-        "Shortcut": [
-            # (Id, Directory_, Name, Component_, Target, Arguments, Description, Hotkey, Icon, IconIndex, ShowCmd, WkDir)
-            (
-                "DesktopShortcut",
-                "DesktopFolder",
-                "BKWSimX",
-                "TARGETDIR",
-                "[TARGETDIR]BKWSimX.exe",
-                None,
-                "Starte BKWSimX",
-                None, None, None, None, None
-            ),
-        ],
-    },
-}
-
-# ---------------------------------------------------------------------------
-# Setup-Aufruf
-# ---------------------------------------------------------------------------
-setup(
-    name="BKWSimX",
-    version=__version__,
-    description="Simulation & Planung steckerfertiger PV-Anlagen",
-    options={
-        "build_exe": build_exe_options,
-        "bdist_msi": bdist_msi_options,
-    },
-    executables=executables,
-)
+# setup.py
+import sys
+import re
+import json
+import subprocess
+import zipfile
+import hashlib
+import urllib.request
+from pathlib import Path
+from cx_Freeze import setup, Executable
+from cx_Freeze.command.build_exe import build_exe as _build_exe
+
+# Alle Pfade relativ zu dieser Datei – unabhängig vom aktuellen Arbeitsverzeichnis
+HERE = Path(__file__).resolve().parent
+SRC = HERE / "src"
+
+# Version direkt aus version.py lesen – ohne das Paket zu importieren
+_version_file = SRC / "bkwsimx" / "version.py"
+__version__ = re.search(
+    r'__version__\s*=\s*["\']([^"\']+)', _version_file.read_text(encoding="utf-8")
+)[1]
+
+# ---------------------------------------------------------------------------
+# Designer-Dateien (.ui) vor dem Freeze mit pyuic6 in Python-Module übersetzen
+# ---------------------------------------------------------------------------
+UI_MODULES = (
+    (SRC / "ui" / "main_window.ui",       SRC / "gui" / "ui_main_window.py"),
+    (SRC / "ui" / "pv_generator_page.ui", SRC / "gui" / "ui_pv_generator_page.py"),
+)
+
+# ---------------------------------------------------------------------------
+# Hardware-Datenbanken (.json) als Python-Literale einfrieren
+# ---------------------------------------------------------------------------
+DATA_MODULE = SRC / "resources" / "_data.py"
+DATA_SOURCES = (
+    ("PV_SYSTEMS", SRC / "resources" / "pv_systems.json"),
+    ("INVERTERS",  SRC / "resources" / "inverters.json"),
+    ("BATTERIES",  SRC / "resources" / "batteries.json"),
+)
+
+
+def _write_data_module() -> None:
+    """Schreibt die JSON-Datenbanken als Python-Modul (resources._data)."""
+    lines = ["# Automatisch von setup.py erzeugt – nicht von Hand bearbeiten.\n"]
+    for name, src in DATA_SOURCES:
+        with open(src, "r", encoding="utf-8") as f:
+            lines.append(f"{name} = {json.load(f)!r}\n")
+    DATA_MODULE.write_text("".join(lines), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Leaflet lokal mitliefern statt zur Laufzeit vom CDN zu laden
+# ---------------------------------------------------------------------------
+LEAFLET_VERSION = "1.9.4"
+LEAFLET_DIR = SRC / "resources" / "leaflet"
+LEAFLET_FILES = (
+    "leaflet.css",
+    "leaflet.js",
+)
+# SHA-256 der Dateien von LEAFLET_VERSION (SRI-Werte der Leaflet-Download-Seite,
+# hier hexadezimal). Das JavaScript landet inline in der Karten-Seite mit
+# QWebChannel-Zugriff auf Python – ohne passende Prüfsumme kein Build.
+LEAFLET_SHA256 = {
+    "leaflet.css": "a7837102824184820dfa198d1ebcd109ff6d0ff9a2672a074b9a1b4d147d04c6",
+    "leaflet.js":  "db49d009c841f5ca34a888c96511ae936fd9f5533e90d8b2c4d57596f4e5641a",
+}
+
+
+def _vendor_leaflet() -> None:
+    """Lädt fehlende Leaflet-Dateien (fest auf LEAFLET_VERSION) einmalig
+    nach src/resources/leaflet – danach baut der Build komplett offline.
+    Jede Datei wird gegen LEAFLET_SHA256 geprüft, auch bereits vorhandene."""
+    base = f"https://unpkg.com/leaflet@{LEAFLET_VERSION}/dist/"
+    for rel in LEAFLET_FILES:
+        dst = LEAFLET_DIR / rel
+        if dst.exists():
+            data = dst.read_bytes()
+        else:
+            with urllib.request.urlopen(base + rel, timeout=30) as resp:
+                data = resp.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if digest != LEAFLET_SHA256[rel]:
+            raise RuntimeError(
+                f"Leaflet-Datei {rel}: SHA-256 {digest} passt nicht zu "
+                f"LEAFLET_SHA256 (Version {LEAFLET_VERSION}) – Build abgebrochen"
+            )
+        if not dst.exists():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_bytes(data)
+
+
+def _recompress_zip(path: Path, level: int = 9) -> None:
+    """Packt *path* mit DEFLATE auf Stufe *level* neu (cx_Freeze nutzt Stufe 6)."""
+    tmp = path.with_suffix(".tmp")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(
+        tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as dst:
+        for info in src.infolist():
+            info.compress_type = zipfile.ZIP_DEFLATED
+            dst.writestr(info, src.read(info), compresslevel=level)
+    tmp.replace(path)
+
+
+def _drop_shadowed_sources(lib_dir: Path) -> None:
+    """Löscht .py-Dateien, neben denen bereits eine .pyc liegt – die EXE lädt
+    ohnehin nur den (mit optimize=2 erzeugten) Bytecode."""
+    for py in lib_dir.rglob("*.py"):
+        if py.with_suffix(".pyc").exists():
+            py.unlink()
+
+
+class build_exe(_build_exe):
+    """build_exe, das vorher alle .ui-Dateien per pyuic6 kompiliert, die
+    JSON-Datenbanken in ein Python-Modul übersetzt und Leaflet lokal
+    bereitstellt. Danach werden
+    überflüssige Quelltexte entfernt und library.zip mit maximaler
+    Kompression neu gepackt."""
+
+    def run(self) -> None:
+        for ui_file, py_file in UI_MODULES:
+            subprocess.run(
+                [sys.executable, "-m", "PyQt6.uic.pyuic", ui_file, "-o", py_file],
+                check=True,
+            )
+        _write_data_module()
+        _vendor_leaflet()
+        super().run()
+        _drop_shadowed_sources(Path(self.build_exe) / "lib")
+        library = Path(self.build_exe) / "lib" / "library.zip"
+        if library.exists():
+            _recompress_zip(library)
+
+
+# ---------------------------------------------------------------------------
+# Build-Optionen für cx_Freeze
+# ---------------------------------------------------------------------------
+build_exe_options = {
+    "include_path": [str(SRC)],
+    # Module explizit auflisten statt "packages" – verhindert das rekursive
+    # Einsammeln aller Untermodule von gui/logic/worker.
+    "includes": [
+        "gui.mainwindow",
+        "gui.ui_main_window",
+        "gui.ui_pv_generator_page",
+        "gui.widgets",
+        "logic.calculation",
+        "worker.calcworker",
+        "bkwsimx.version",
+        "resources",
+        "resources._data",
+    ],
+    # Nur Pakete ausschließen, die in der Build-Umgebung tatsächlich installiert
+    # sind bzw. von matplotlib/pandas/pvlib optional importiert werden –
+    # alles andere findet der ModuleFinder ohnehin nicht.
+    "excludes": [
+        "tkinter", "PyQt5", "PySide2", "PySide6",
+        "IPython", "pytest", "sphinx", "numba",
+        "gi", "cairo", "cairocffi", "wx",
+        "openpyxl", "lxml", "bs4", "docutils", "yaml",
+        "pandas.tests",
+        "matplotlib.tests",
+        "matplotlib.sphinxext",
+    ],
+    # Reine Python-Pakete in library.zip bündeln (weniger Einzeldatei-Zugriffe
+    # beim Start). Ausgenommen bleiben Pakete, die Dateien relativ zu
+    # __file__ suchen (gui, logic) oder Daten/Plugins auf der Platte brauchen.
+    "zip_include_packages": ["*"],
+    "compress": True,
+    "zip_exclude_packages": [
+        "encodings", "gui", "logic", "PyQt6", "matplotlib", "pvlib",
+    ],
+    # Die App liest die Datenbanken aus resources._data; die JSON-Dateien
+    # liegen trotzdem bei, main.setup_user_profile() kopiert sie ins
+    # Benutzerprofil
+    "include_files": [
+        (str(SRC / "resources" / "batteries.json"),  "lib/resources/batteries.json"),
+        (str(SRC / "resources" / "inverters.json"),  "lib/resources/inverters.json"),
+        (str(SRC / "resources" / "pv_systems.json"), "lib/resources/pv_systems.json"),
+    ],
+    # Icons, Karten-Seite und Leaflet direkt in library.zip (resources/…)
+    # statt als lose Dateien – gelesen über resources.read_bytes()
+    "zip_includes": [
+        (str(SRC / "icons" / "icon.ico"),   "resources/icons/icon.ico"),
+        (str(SRC / "icons" / "splash.png"), "resources/icons/splash.png"),
+        (str(SRC / "resources" / "map.html"), "resources/map.html"),
+    ] + [
+        (str(LEAFLET_DIR / rel), f"resources/leaflet/{rel}") for rel in LEAFLET_FILES
+    ],
+    # Nicht benötigte Qt-Plugins/DLLs (SQL-Treiber, ungenutzte Bildformate,
+    # Software-OpenGL). QtWebEngine samt Quick/Qml bleibt – die Karte braucht es.
+    "bin_excludes": [
+        "qsqlmysql.dll", "qsqlodbc.dll", "qsqlpsql.dll",
+        "qtiff.dll", "qwebp.dll",
+        "opengl32sw.dll",
+    ],
+    # Bytecode ohne Docstrings/asserts (entspricht python -OO)
+    "optimize": 2,
+    # Version als Literal ins Modul BUILD_CONSTANTS backen (bkwsimx/__init__.py)
+    "constants": [f"VERSION={__version__!r}"],
+}
+
+# ---------------------------------------------------------------------------
+# Executables definieren (mit korrekten Shortcut-Parametern)
+# ---------------------------------------------------------------------------
+base = "Win32GUI" if sys.platform == "win32" else None
+
+executables = [
+    Executable(
+        script=str(SRC / "main.py"),
+        base=base,
+        target_name="BKWSimX.exe",
+        icon=str(SRC / "icons" / "icon.ico"),
+        shortcut_name="BKWSimX",            # Startmenü-Shortcut 
+        shortcut_dir="ProgramMenuFolder",    # 
+    ),
+    Executable(
+        script=str(SRC / "launch_debug.py"),
+        base=None,
+        target_name="BKWSimX_debug.exe",
+        icon=str(SRC / "icons" / "icon.ico"),
+        shortcut_name="BKWSimX Debug",
+        shortcut_dir="ProgramMenuFolder",
+    ),
+]
+
+# ---------------------------------------------------------------------------
+# MSI-Optionen: Upgrade, Pfad, Lizenz & Shortcuts über data
+# ---------------------------------------------------------------------------
+# MSI-Tabelle „Shortcut“: Desktop-Verknüpfung
+# (Id, Directory_, Name, Component_, Target, Arguments, Description, Hotkey, Icon, IconIndex, ShowCmd, WkDir)
+SHORTCUT_TABLE = (
+    (
+        "DesktopShortcut",
+        "DesktopFolder",
+        "BKWSimX",
+        "TARGETDIR",
+        "[TARGETDIR]BKWSimX.exe",
+        None,
+        "Starte BKWSimX",
+        None, None, None, None, None
+    ),
+)
+
+
+def _msi_up_to_date() -> bool:
+    """True, wenn für diese Version schon ein MSI existiert, das neuer ist
+    als alle Dateien unter src/ und setup.py selbst."""
+    msis = list((HERE / "dist").glob(f"BKWSimX-{__version__}-*.msi"))
+    if not msis:
+        return False
+    newest_input = max(
+        [p.stat().st_mtime for p in SRC.rglob("*") if p.is_file()]
+        + [(HERE / "setup.py").stat().st_mtime]
+    )
+    return min(m.stat().st_mtime for m in msis) >= newest_input
+
+
+cmdclass = {"build_exe": build_exe}
+options = {"build_exe": build_exe_options}
+
+# MSVC-Runtime und MSI gibt es nur unter Windows – auf Linux/macOS weder
+# msilib importieren noch die MSVCR-Kopierlogik anstoßen.
+if sys.platform == "win32":
+    from cx_Freeze.command.bdist_msi import bdist_msi as _bdist_msi
+
+    build_exe_options["include_msvcr"] = True
+
+    class bdist_msi(_bdist_msi):
+        """bdist_msi, das Freeze + MSI-Erzeugung bei unveränderten Quellen überspringt."""
+
+        def run(self) -> None:
+            if _msi_up_to_date():
+                print(f"MSI für {__version__} ist aktuell – Build übersprungen.")
+                return
+            super().run()
+
+    bdist_msi_options = {
+        "all_users": True,  # Installation für alle Benutzer :contentReference[oaicite:2]{index=2}
+        "add_to_path": False,  # nicht automatisch in PATH :contentReference[oaicite:3]{index=3}
+        # 64-Bit-Standardpfad – für 32-Bit käme [ProgramFilesFolder]
+        "initial_target_dir": r"[ProgramFiles64Folder]\BKWSimX",  # :contentReference[oaicite:4]{index=4}
+        # Upgrade-Code (gleich lassen für sauberen Versionswechsel)
+        "upgrade_code": "{12345678-90AB-CDEF-1234-567890ABCDEF}",  # :contentReference[oaicite:5]{index=5}
+        # Lizenz-Dialog (RTF)
+        "license_file": str(SRC / "LICENSE.rtf"),                # :contentReference[oaicite:6]{index=6}
+        "data": {
+            "Shortcut": list(SHORTCUT_TABLE),
+        },
+    }
+
+    cmdclass["bdist_msi"] = bdist_msi
+    options["bdist_msi"] = bdist_msi_options
+
+# ---------------------------------------------------------------------------
+# Setup-Aufruf
+# ---------------------------------------------------------------------------
+setup(
+    name="BKWSimX",
+    version=__version__,
+    description="Simulation & Planung steckerfertiger PV-Anlagen",
+    cmdclass=cmdclass,
+    options=options,
+    executables=executables,
+)
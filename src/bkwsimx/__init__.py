@@ -1 +1,39 @@
-from .version import __version__
\ No newline at end of file
+"""BKWSimX – Paket-Einstieg.
+
+Nur `__version__` wird sofort geladen. GUI-, Rechen- und Worker-Klassen
+werden erst beim ersten Zugriff importiert (PEP 562), damit `import bkwsimx`
+nicht Qt, pandas oder pvlib nach sich zieht.
+"""
+import importlib
+
+# Gefrorene EXE: Version aus dem von cx_Freeze erzeugten BUILD_CONSTANTS,
+# sonst aus version.py (Quellcode-Start).
+try:
+    from BUILD_CONSTANTS import VERSION as __version__
+except ImportError:
+    from .version import __version__
+
+# Name → (Modul, Attribut) für die verzögerten Exporte
+_LAZY_EXPORTS = {
+    "MainWindow":      ("gui.mainwindow",    "MainWindow"),
+    "Settings":        ("logic.calculation", "Settings"),
+    "GeneratorConfig": ("logic.calculation", "GeneratorConfig"),
+    "run_calculation": ("logic.calculation", "run_calculation"),
+    "CalcWorker":      ("worker.calcworker", "CalcWorker"),
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value          # nächster Zugriff ohne __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 # Qt‑GUI‑Klasse für BKWSimX.
 
-# * Lädt die Designer‑Datei `ui/main_window.ui` zur Laufzeit ⇒ kein pyuic‑Schritt nötig.
+# * Nutzt die per pyuic6 erzeugten Module `gui.ui_main_window` / `gui.ui_pv_generator_page`
+#   (werden beim build_exe aus den Designer‑Dateien in `ui/` neu erzeugt).
 # * Verbindet den *Berechnen‑Button* mit einem `CalcWorker` (QThread).
 # * Liest beim Start **alle** Eingaben aus den Widgets und füllt ein `Settings`‑Dataclass,
 #   das an `run_calculation()` geht.
@@ -18,65 +19,135 @@ from __future__ import annotations
 from bkwsimx import __version__
 
 import logging
-import calendar
-import mplcursors
 import json
+import re
+import functools
+import os
 import sys
+import importlib.util
+import threading
+import numpy as np
+import time
 
 from dataclasses import asdict
+from types import SimpleNamespace
+from typing import Sequence
 from pathlib                            import Path
-from PyQt6                              import QtCore, QtWidgets, uic
-from PyQt6.QtGui        import QStandardItemModel, QStandardItem, QFont, QIcon, QFontDatabase
+from PyQt6                              import QtCore, QtWidgets
+from PyQt6.QtGui        import QStandardItemModel, QStandardItem, QFont, QIcon, QFontDatabase, QPixmap
 from PyQt6.QtWidgets    import QHeaderView, QMessageBox, QFileDialog, QVBoxLayout, QPlainTextEdit, QDialog, QPushButton, QProgressDialog
-from PyQt6.QtWebEngineWidgets           import QWebEngineView
-from PyQt6.QtWebChannel                 import QWebChannel
 from PyQt6.QtCore                       import QUrl, QObject, pyqtSignal, pyqtSlot
-from matplotlib.backends.backend_qtagg  import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure                  import Figure
+# QtWebEngine, matplotlib, mplcursors und requests werden erst in den
+# Methoden importiert, die sie brauchen – der Splash erscheint so früher.
 
 import logic.calculation as calc_mod
-from datetime import datetime
+from collections import deque
 
 from gui.widgets import TiltWidget, AzimuthWidget
+from gui.ui_main_window import Ui_MainWindow
+from gui.ui_pv_generator_page import Ui_Form as Ui_GeneratorPage
 
 from logic.calculation import (
     GeneratorConfig, Settings, run_calculation,
     _pv_systems, _inverters, _batteries,
-    _sys_by_name, _inv_by_id, _batt_by_id, _batt_by_model, _inv_by_model, get_battery_spec,
+    _sys_by_name, _sys_by_manufacturer, MANUFACTURERS, _inv_by_id, _batt_by_id, _batt_by_model, _inv_by_model,
     calculate_avg_system_efficiency, calculate_avg_storage_efficiency, compute_total_losses,
 )
 from worker.calcworker import CalcWorker
-import requests                           # ➊ für Geocoding
+from resources import read_bytes as read_resource
 
-HEADERS = {"User-Agent": "BKWSimX/1.0"}   # ➋ Nominatim verlangt UA
+try:                                    # optional: schneller JSON-Codec (C-Extension)
+    import orjson
+    _ORJSON_OPTS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    orjson = None
+
+HEADERS = {"User-Agent": "BKWSimX/1.0"}   # Nominatim verlangt UA
+
+# ---------------------------------------------------------------------------
+# Projektdateien (JSON) – orjson, falls installiert, sonst json
+# ---------------------------------------------------------------------------
+def _dump_project(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+    return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+
+def _load_project(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _read_project(path: str) -> Settings:
+    """Liest eine Projektdatei und baut daraus `Settings` (läuft im I/O-Pool)."""
+    data = _load_project(Path(path).read_bytes())
+    # mppts als Dicts → in GeneratorConfig-Objekte umwandeln
+    if "mppts" in data:
+        data["mppts"] = [
+            GeneratorConfig(**mp) for mp in data["mppts"]
+        ]
+    # alle anderen Felder bleiben unverändert
+    return Settings(**data)
+
+
+@functools.lru_cache(maxsize=1)
+def _nominatim_session():
+    """
+    Gemeinsame `requests.Session` für alle Nominatim-Abfragen: TCP-/TLS-
+    Verbindung bleibt zwischen »zu Adresse« und »zu Koordinaten« erhalten,
+    vorübergehende Fehler (429/5xx) werden mit Backoff wiederholt.
+    Wird erst beim ersten Geocoding angelegt (requests bleibt lazy).
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4, pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 502, 503, 504]),
+    ))
+    return session
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _month_abbr(idx: int | str) -> str:
-    """Gibt die englische Monatsabkürzung zurück, 1→'Jan'. Akzeptiert auch String-Indices."""
-    # Key aus JSON ist ein String, also sicherheitshalber in int konvertieren
-    idx_int = int(idx)
-    return calendar.month_abbr[idx_int]
+# Englische Monatskürzel wie in den Objektnamen der .ui (spinBox_Verschattung_Jan …).
+# Fest hinterlegt statt calendar.month_abbr – das ist locale-abhängig und Qt
+# setzt die Locale beim Start der QApplication um.
+_MON_ABBR_EN = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+# MPPT-Spinboxen heißen spinBox_PV_Generator_MPPT<i>_…
+_MPPT_SPIN_RE = re.compile(r"_MPPT(\d)_")
+
+# Objektnamen der zwölf Verschattungs-Spinboxen, Index 0 = Januar
+_SHADE_SPIN_NAMES: tuple[str, ...] = tuple(
+    f"spinBox_Verschattung_{_MON_ABBR_EN[m]}" for m in range(1, 13)
+)
+
+# Obergrenze für zwischengespeicherte Generator-Seiten (eine je MPPT-Eingang)
+_PAGE_POOL_MAX = 4
 
-def _consecutive_month_ranges(month_list: list[int]) -> list[tuple[int, int]]:
+@functools.lru_cache(maxsize=256)
+def _consecutive_month_ranges(month_list: tuple[int, ...]) -> tuple[tuple[int, int], ...]:
     """
-    z.B. [11,12,1,2]  ➜  [(11, 2)]
-         [1,2,3,7,8] ➜  [(1,3), (7,8)]
+    z.B. (11,12,1,2)  ➜  ((11, 2),)
+         (1,2,3,7,8) ➜  ((1,3), (7,8))
+
+    Erwartet ein sortiertes, duplikatfreies Tupel (hashbar für den Cache).
     """
     if not month_list:
-        return []
-    month_list = sorted(set(month_list))
-    ranges, start = [], month_list[0]
-    prev = start
-    for m in month_list[1:]:
-        if (prev % 12) + 1 != m:           # Lücke
-            ranges.append((start, prev))
-            start = m
-        prev = m
-    ranges.append((start, prev))
-    return ranges
+        return ()
+    arr = np.fromiter(month_list, dtype=np.int8, count=len(month_list))
+    # Lücke, wo der Folgemonat nicht (Vormonat % 12) + 1 ist
+    breaks = np.flatnonzero((arr[:-1] % 12) + 1 != arr[1:]) + 1
+    return tuple((int(g[0]), int(g[-1])) for g in np.split(arr, breaks))
 
 def build_mppt_fields(n: int) -> None:
     # TODO: echte Felder dynamisch erzeugen.
@@ -84,15 +155,18 @@ def build_mppt_fields(n: int) -> None:
     print(f"[DEBUG] MPPT‑Felder für {n} Tracker würden hier gebaut.")
     
 # Deutsche Monatsnamen selbst hinterlegen (keine Locale-Spielchen nötig)
-_MON_DE = [
+_MON_DE = (
     "", "Januar", "Februar", "März", "April", "Mai", "Juni",
     "Juli", "August", "September", "Oktober", "November", "Dezember",
-]
+)
 
-def _disabled_label(disabled: list[int]) -> str:
+@functools.lru_cache(maxsize=256)
+def _disabled_label(disabled: tuple[int, ...]) -> str:
     """
     Liefert z. B.
       »Mögliche Speicherabschaltung: Dezember bis Januar, März«
+
+    *disabled* ist ein sortiertes, duplikatfreies Tupel der Monate.
     """
     if not disabled:
         return "nicht notwendig"
@@ -112,17 +186,132 @@ def _disabled_label(disabled: list[int]) -> str:
     #return "Mögliche Speicherabschaltung: " + ", ".join(parts[::-1])
     return " und ".join(parts[::-1])
 
-def _resource_path(rel: str) -> str:
+def _month_array(dat: dict, key: str) -> np.ndarray:
+    """Monatswerte `dat[key]` (Series/Liste, None → Nullen) als float-Array."""
+    ser = dat.get(key)
+    return np.zeros(12) if ser is None else np.asarray(ser, dtype=float)
+
+# Combobox-Einträge (Text, id) der statischen Datenbanken – einmal beim Import
+_PV_SYSTEM_ITEMS = tuple((s["name"], s["id"]) for s in _pv_systems)
+_INVERTER_ITEMS  = tuple((inv["model"], inv["id"]) for inv in _inverters)
+_BATTERY_ITEMS   = tuple((bat["model"], bat["id"]) for bat in _batteries)
+
+# Verschaltung: Anzeige-Text + GeneratorConfig.connection als Item-Daten
+_CONN_ITEMS_SINGLE = (("direkt", "direct"),)
+_CONN_ITEMS        = (("direkt", "direct"), ("reihe", "series"))
+_SHADE_LVL_ITEMS   = tuple((lvl, None) for lvl in ("keine", "leicht", "mittel", "stark"))
+
+# Unicode-Bindestriche (‑ U+2011, ‐ U+2010) → ASCII '-' für Verlust-Labels
+_DASH_TRANS = str.maketrans({"\u2011": "-", "\u2010": "-"})
+
+def _fill_combo(box: QtWidgets.QComboBox, entries: Sequence[tuple[str, object]]) -> None:
+    """Ersetzt den Inhalt von *box* in einem Rutsch: neues Item-Modell
+    aufbauen (ohne angeschlossene View) und per setModel tauschen, statt
+    je Eintrag ein addItem. Das alte Modell (Parent = box) löscht Qt selbst.
+    Stimmt der Inhalt schon, wird nur auf den ersten Eintrag gesprungen."""
+    if box.count() == len(entries) and all(
+        box.itemText(i) == text and box.itemData(i) == data
+        for i, (text, data) in enumerate(entries)
+    ):
+        box.setCurrentIndex(0)
+        return
+    model = QStandardItemModel(box)
+    items = []
+    for text, data in entries:
+        item = QStandardItem(text)
+        if data is not None:
+            item.setData(data, QtCore.Qt.ItemDataRole.UserRole)
+        items.append(item)
+    model.invisibleRootItem().appendRows(items)
+    box.setUpdatesEnabled(False)
+    try:
+        box.setModel(model)
+    finally:
+        box.setUpdatesEnabled(True)
+
+@functools.lru_cache(maxsize=1)
+def _fixed_font() -> QFont:
+    """Monospace-Font für die Debug-Konsole; die Font-Datenbank wird nur
+    beim ersten Aufruf befragt."""
+    # 1) System-Monospace-Font holen
+    fixed = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+    # 2) Alternativ, falls das nicht liefert, hart auf Courier umschwenken:
+    if not fixed.fixedPitch():
+        fixed = QFont("Courier New")
+        fixed.setStyleHint(QFont.StyleHint.Monospace)
+    # 3) Größe anpassen
+    fixed.setPointSize(10)
+    return fixed
+
+# ---------------------------------------------------------------------------
+# Leaflet für die Standort-Karte
+# ---------------------------------------------------------------------------
+_LEAFLET_CDN = "https://unpkg.com/leaflet@1.9.4/dist/"
+_MAP_JS = "marker.setLatLng([{lat}, {lon}]);map.setView([{lat}, {lon}], map.getZoom());"
+
+def _leaflet_head() -> str:
     """
-    Liefert einen plattform-unabhängigen Pfad, der sowohl im
-    Quell-Code-Verzeichnis als auch in der gefrorenen EXE funktioniert.
-    Sucht zuerst im Basis­verzeichnis, dann in »lib/« (cx_Freeze).
+    Liefert die <head>-Einträge für Leaflet.
+
+    Liegt Leaflet unter `resources/leaflet` (legt setup.py beim Build ab und
+    prüft dabei die SHA-256-Summen), werden CSS/JS direkt in die Seite
+    eingebettet – der Start wartet dann nicht mehr auf das CDN. Fehlen die
+    Dateien (z. B. frischer Quellbaum), wird unpkg.com verwendet. Die
+    Marker-Bilder kommen in beiden Fällen aus dem (versionsfesten) CDN-Pfad.
     """
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
-    for cand in (base / rel, base / "lib" / rel):
-        if cand.exists():
-            return str(cand)
-    raise FileNotFoundError(rel)
+    try:
+        css = read_resource("leaflet/leaflet.css").decode("utf-8")
+        js  = read_resource("leaflet/leaflet.js").decode("utf-8")
+    except FileNotFoundError:
+        return (f'<link rel="stylesheet" href="{_LEAFLET_CDN}leaflet.css" />\n'
+                f'<script src="{_LEAFLET_CDN}leaflet.js"></script>')
+    return (f"<style>{css}</style>\n<script>{js}</script>\n"
+            f"<script>L.Icon.Default.imagePath = '{_LEAFLET_CDN}images/';</script>")
+
+@functools.lru_cache(maxsize=1)
+def _map_html() -> str:
+    """Karten-Seite aus `resources/map.html` inkl. Leaflet; wird nur beim
+    ersten MainWindow gelesen und zusammengesetzt."""
+    html = read_resource("map.html").decode("utf-8")
+    return html.replace("<!--LEAFLET-->", _leaflet_head())
+
+# ---------------------------------------------------------------------------
+# Designer-Klassen: vorkompiliert (pyuic6), bei geänderter .ui aus dem Cache
+# ---------------------------------------------------------------------------
+_UI_DIR       = Path(__file__).resolve().parent.parent / "ui"
+_UI_CACHE_DIR = Path(os.getenv("APPDATA") or Path.home() / ".cache") / "BKWSimX" / "ui_cache"
+
+def _compiled_ui_class(ui_name: str, shipped: type) -> type:
+    """
+    Liefert die Ui-Klasse für `ui/<ui_name>.ui`.
+
+    Normalfall (und immer in der EXE): die mitgelieferte, per pyuic6 erzeugte
+    Klasse *shipped*. Ist die .ui-Datei im Quellbaum neuer als das erzeugte
+    Modul, wird sie einmalig kompiliert und – mit mtime+Größe als Schlüssel –
+    in `_UI_CACHE_DIR` abgelegt; spätere Starts laden nur noch den Cache.
+    """
+    if getattr(sys, "frozen", False):
+        return shipped
+    ui_file = _UI_DIR / f"{ui_name}.ui"
+    if not ui_file.exists():
+        return shipped
+    st = ui_file.stat()
+    if st.st_mtime <= Path(sys.modules[shipped.__module__].__file__).stat().st_mtime:
+        return shipped
+
+    cache = _UI_CACHE_DIR / f"{ui_name}_{st.st_mtime_ns}_{st.st_size}.py"
+    if not cache.exists():
+        from PyQt6 import uic
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache, "w", encoding="utf-8") as fh:
+            uic.compileUi(str(ui_file), fh)
+    spec = importlib.util.spec_from_file_location(f"_ui_cache_{ui_name}", cache)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, shipped.__name__)
+
+Ui_MainWindow    = _compiled_ui_class("main_window", Ui_MainWindow)
+Ui_GeneratorPage = _compiled_ui_class("pv_generator_page", Ui_GeneratorPage)
 
 # ---------------------------------------------------------------------------
 # MapBridge
@@ -136,18 +325,201 @@ class MapBridge(QObject):
         # Wird aus JS aufgerufen
         self.coordinatesChanged.emit(lat, lon)
 
+# ---------------------------------------------------------------------------
+# Hintergrund-Aufgaben (QThreadPool)
+# ---------------------------------------------------------------------------
+class _TaskSignals(QObject):
+    finished = pyqtSignal(object)       # Rückgabewert von fetch
+    failed   = pyqtSignal(str)
+
+class _BackgroundTask(QtCore.QRunnable):
+    """Führt *fetch(*args)* in einem Pool-Thread aus (Geocoding, Projekt-
+    Dateien). Ergebnis/Fehler gehen per Signal (queued) zurück in den
+    GUI-Thread."""
+
+    def __init__(self, fetch, *args) -> None:
+        super().__init__()
+        self.fetch = fetch
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        try:
+            self.signals.finished.emit(self.fetch(*self.args))
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+
+# ---------------------------------------------------------------------------
+# Geocoding im Hintergrund
+# ---------------------------------------------------------------------------
+_NOMINATIM_URL = "https://nominatim.openstreetmap.org"
+
+def _nominatim_get(endpoint: str, params: dict):
+    r = _nominatim_session().get(f"{_NOMINATIM_URL}/{endpoint}",
+                                 params=params, timeout=15)
+    r.raise_for_status()
+    return r.json()
+
+@functools.lru_cache(maxsize=256)
+def _nominatim_reverse(lat: float, lon: float) -> dict:
+    """Koordinaten → Adresse. Aufrufer runden auf 5 Nachkommastellen
+    (~1 m), damit wiederholte Abfragen aus dem Cache kommen."""
+    return _nominatim_get("reverse", {"lat": lat, "lon": lon, "format": "json"})
+
+@functools.lru_cache(maxsize=256)
+def _nominatim_search(street: str, city: str, postalcode: str, country: str) -> list:
+    """Adresse → Treffer-Liste (max. 1). Fehler werden nicht gecacht."""
+    return _nominatim_get("search", {
+        "street":      street,
+        "city":        city,
+        "postalcode":  postalcode,
+        "country":     country,
+        "format":      "json",
+        "limit":       1,
+    })
+
+# ---------------------------------------------------------------------------
+# Ergebnis-Tabelle
+# ---------------------------------------------------------------------------
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_FONT_ROLE    = QtCore.Qt.ItemDataRole.FontRole
+
+class ResultTableModel(QtCore.QAbstractTableModel):
+    """
+    Schlankes Tabellen-Modell für den Ergebnis-Tab: Zellen liegen in einem
+    2-D-Objekt-Array (None = leere Zelle), Überschriftszeilen in einer
+    Bool-Maske. Ein Ergebnis wird mit einem einzigen Model-Reset gesetzt –
+    keine QStandardItem-Objekte je Zelle.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._headers: list[str] = []
+        self._data = np.empty((0, 0), dtype=object)
+        self._bold_rows = np.zeros(0, dtype=bool)
+        # eine Font-Instanz für alle Überschriftszeilen (FontRole)
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    def set_headers(self, headers: Sequence[str]) -> None:
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._data = np.empty((0, len(self._headers)), dtype=object)
+        self._bold_rows = np.zeros(0, dtype=bool)
+        self.endResetModel()
+
+    def reset_with(self, data: np.ndarray, bold_rows: np.ndarray) -> None:
+        self.beginResetModel()
+        self._data = data
+        self._bold_rows = bold_rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._data.shape[0]
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # wird je Zelle und Rolle beim Zeichnen aufgerufen → Rollen als
+        # Modul-Konstanten statt dreistufiger Enum-Attributzugriffe
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._data[index.row(), index.column()]
+        if role == _FONT_ROLE and self._bold_rows[index.row()]:
+            return self._bold
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if (orientation == QtCore.Qt.Orientation.Horizontal
+                and role == _DISPLAY_ROLE
+                and section < len(self._headers)):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+# ---------------------------------------------------------------------------
+# Generator-Seite
+# ---------------------------------------------------------------------------
+class GeneratorPage(QtWidgets.QWidget, Ui_GeneratorPage):
+    """Eine PV-Generator-Seite aus dem vorkompilierten `pv_generator_page.ui`."""
+
+    # objectNames der MPPT-Spinboxen je Tracker-Index – alle Seiten stammen aus
+    # derselben .ui, daher nur bei der ersten Seite per findChildren ermittelt
+    _mppt_spin_names: dict[int, tuple[str, ...]] | None = None
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setupUi(self)
+        # Eingabe-Widgets einmalig merken – _collect_settings liest nur noch
+        # Attribute statt je Klick den Objektbaum per findChild zu durchsuchen
+        self._w = SimpleNamespace(
+            n_mod  = self.spinBox_Modulanzahl_Generator_,
+            conn   = self.comboBox_Verschaltung_Generator_,
+            wp_mod = self.spinBox_Leistung_Generator_,
+            tilt   = self.spinBox_Neigung_Generator_,
+            azm    = self.spinBox_Azimut_Generator_,
+            mppt   = self.comboBox_MPPT_Input,
+            shade_lvl  = self.comboBox_Shade_Level,
+            shade_mon  = self.radioButton_Shade_Monthly,
+            tilt_frame = self.frame_neigung,
+            azm_frame  = self.frame_azimut,
+            shade  = tuple(getattr(self, name) for name in _SHADE_SPIN_NAMES),
+        )
+        # MPPT-Spinboxen je Tracker-Index (1–4)
+        cls = type(self)
+        if cls._mppt_spin_names is None:
+            names: dict[int, list[str]] = {i: [] for i in range(1, 5)}
+            for sp in self.findChildren(QtWidgets.QSpinBox):
+                m = _MPPT_SPIN_RE.search(sp.objectName())
+                if m and int(m[1]) in names:
+                    names[int(m[1])].append(sp.objectName())
+            cls._mppt_spin_names = {i: tuple(n) for i, n in names.items()}
+        self._mppt_spins: dict[int, list[QtWidgets.QSpinBox]] = {
+            i: [getattr(self, n) for n in names]
+            for i, names in cls._mppt_spin_names.items()
+        }
+        # Ausgangswerte *aller* Eingaben aus der .ui (inkl. MPPT-Spinboxen) –
+        # für reset(), wenn die Seite aus dem Seiten-Pool wiederverwendet wird
+        self._spin_defaults = [
+            (sp, sp.value())
+            for sp in (*self.findChildren(QtWidgets.QSpinBox),
+                       *self.findChildren(QtWidgets.QDoubleSpinBox))
+        ]
+        self._radio_defaults = [(rb, rb.isChecked())
+                                for rb in self.findChildren(QtWidgets.QRadioButton)]
+        self._combos = self.findChildren(QtWidgets.QComboBox)
+
+    def reset(self) -> None:
+        """Setzt alle Eingaben auf die Ausgangswerte zurück. Sämtliche
+        Eingabe-Widgets sind dabei gesperrt – auch der Geschwister-Radio-Button
+        feuert kein toggled."""
+        widgets = (*(sp for sp, _ in self._spin_defaults),
+                   *(rb for rb, _ in self._radio_defaults), *self._combos)
+        blockers = [QtCore.QSignalBlocker(wd) for wd in widgets]
+        for sp, val in self._spin_defaults:
+            sp.setValue(val)
+        for rb, checked in self._radio_defaults:
+            if checked:
+                rb.setChecked(True)                 # exklusiv → Geschwister aus
+        for cb in self._combos:
+            cb.setCurrentIndex(0)
+        del blockers
+
 # ---------------------------------------------------------------------------
 # MainWindow
 # ---------------------------------------------------------------------------
 
-class MainWindow(QtWidgets.QMainWindow):
-    """Haupt‑Fenster.  Lädt .ui zur Laufzeit – kein Kompilieren nötig."""
+class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
+    """Haupt‑Fenster.  Oberfläche stammt aus dem vorkompilierten `ui_main_window`."""
 
     def __init__(self) -> None:
         super().__init__()
         
         # Fenster- & App-Icon setzen  → erscheint in Titelleiste + About-Dialog
-        icon = QIcon(_resource_path("icons/icon.ico"))
+        icon_pix = QPixmap()
+        icon_pix.loadFromData(read_resource("icons/icon.ico"))
+        icon = QIcon(icon_pix)
         self.setWindowIcon(icon)                    # Titelleisten-Icon
         app = QtWidgets.QApplication.instance()
         if app is not None:
@@ -156,14 +528,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self._has_result = False
 
         # ------------------------------------------------------------
-        #   1) UI laden
+        #   1) UI aufbauen (pyuic6-Modul, kein XML-Parsing zur Laufzeit)
         # ------------------------------------------------------------
-        ui_path = (
-            Path(__file__).resolve().parent.parent / "ui" / "main_window.ui"
-        )
-        if not ui_path.exists():
-            raise FileNotFoundError(ui_path)
-        uic.loadUi(ui_path, self)                        # type: ignore[arg-type]
+        self.setupUi(self)
+
+        # Platzhalter-Seite aus dem Designer sofort entfernen (leeres QWidget;
+        # echte Seiten baut GeneratorPage aus der vorkompilierten Ui-Klasse).
+        # Danach enthält stackedWidget_Generator nur GeneratorPage-Objekte.
+        placeholder = self.stackedWidget_Generator.widget(0)
+        self.stackedWidget_Generator.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+        # MPPT-Widgets im Hauptfenster je Tracker-Index (Label + Tippfehler-
+        # Variante der Modul-SpinBox) – für _rebuild_mppt_fields
+        self._mppt_extra: dict[int, list[QtWidgets.QWidget]] = {
+            i: [w for w in (
+                self.findChild(QtWidgets.QSpinBox, f"spinBox_PV_Generator_MPPT1_Module_{i}"),
+                self.findChild(QtWidgets.QLabel, f"label_PV_Generator_MPPT{i}"),
+            ) if w is not None]
+            for i in range(1, 5)
+        }
         
         # ------------------------------------------------------------
         #  eigener Fenstertitel (überschreibt Wert aus der .ui-Datei)
@@ -181,17 +565,10 @@ class MainWindow(QtWidgets.QMainWindow):
         layout = QVBoxLayout(self._debug_window)
         self._debug_console = QPlainTextEdit(self._debug_window)
         self._debug_console.setReadOnly(True)
+        self._debug_console.setMaximumBlockCount(5000)   # ältere Zeilen verwerfen
         layout.addWidget(self._debug_console)
-        # 1) System-Monospace-Font holen
-        fixed = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
-        # 2) Alternativ, falls das nicht liefert, hart auf Courier umschwenken:
-        if not fixed.fixedPitch():  
-            fixed = QFont("Courier New")
-            fixed.setStyleHint(QFont.StyleHint.Monospace)
-        # 3) Größe anpassen (optional)
-        fixed.setPointSize(10)
-        # 4) Anwenden
-        self._debug_console.setFont(fixed)
+        # Monospace-Font (einmal je Prozess ermittelt)
+        self._debug_console.setFont(_fixed_font())
         # Clear-Button
         self._btn_clear_debug = QPushButton("Löschen", self._debug_window)
         layout.addWidget(self._btn_clear_debug)
@@ -201,14 +578,36 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Logging-Handler, der in das Text-Widget schreibt, ohne Modul-Name:
         class QtHandler(logging.Handler):
-            """Logging-Handler, der Einträge in das QPlainTextEdit schreibt, mit SCN-Präfix und Zeitstempel."""
+            """Logging-Handler, der Einträge in das QPlainTextEdit schreibt, mit SCN-Präfix und Zeitstempel.
+
+            `emit` (beliebiger Thread) puffert nur die fertige Zeile; ein Timer im
+            GUI-Thread hängt alle gepufferten Zeilen alle 100 ms in einem Rutsch an.
+            """
             def __init__(self, widget: QPlainTextEdit):
                 super().__init__()
                 self.widget = widget
+                self._pending: deque[str] = deque()
+                self._pending_lock = threading.Lock()
+                # läuft nur, solange das Debug-Fenster offen ist (_toggle_debug_window)
+                self.timer = QtCore.QTimer(widget)
+                self.timer.setInterval(100)
+                self.timer.timeout.connect(self.flush_pending)
+
+            def flush_pending(self) -> None:
+                with self._pending_lock:
+                    if not self._pending:
+                        return
+                    batch = list(self._pending)
+                    self._pending.clear()
+                self.widget.appendPlainText("\n".join(batch))
 
             def emit(self, record: logging.LogRecord) -> None:
-                # 1) Zeitstempel erzeugen
-                ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+                # 0) Fenster zu → niemand sieht die Zeile
+                if not self.widget.isVisible():
+                    return
+                # 1) Zeitstempel aus dem Record (statt datetime.now())
+                ts = (time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.created))
+                      + f",{int(record.msecs):03d}")
                 # 2) Message inkl. Argumente (record.getMessage() macht das %-Formatting)
                 text = record.getMessage()
                 # 3) Szenario-Präfix voranstellen (wenn gesetzt)
@@ -217,13 +616,9 @@ class MainWindow(QtWidgets.QMainWindow):
                     text = f"[SCN{scn}] {text}"
                 # 4) Gesamte Zeile zusammenbauen
                 full = f"{ts} [{record.levelname}] {text}"
-                # 5) Thread-sicher in die GUI-Schleife einreihen
-                QtCore.QMetaObject.invokeMethod(
-                    self.widget,
-                    "appendPlainText",
-                    QtCore.Qt.ConnectionType.QueuedConnection,
-                    QtCore.Q_ARG(str, full)
-                )
+                # 5) Thread-sicher puffern – Ausgabe übernimmt flush_pending
+                with self._pending_lock:
+                    self._pending.append(full)
 
         # direkt nach der Handler-Definition
         self._qt_handler = QtHandler(self._debug_console)
@@ -232,9 +627,7 @@ class MainWindow(QtWidgets.QMainWindow):
         fmt = logging.Formatter("%(message)s")
         self._qt_handler.setFormatter(fmt)
 
-        calc_logger = logging.getLogger("logic.calculation")
-        calc_logger.setLevel(logging.DEBUG)
-        calc_logger.addHandler(self._qt_handler)
+        # Handler wird erst mit dem Debug-Fenster angehängt (_toggle_debug_window)
 
         # Checkbox verbinden (öffen/​schließen)
         self.checkBox_debug_window.toggled.connect(self._toggle_debug_window)
@@ -251,13 +644,32 @@ class MainWindow(QtWidgets.QMainWindow):
         #   1b) GUI-Elemente initialisieren
         # ------------------------------------------------------------
 
-        # Liste aller GeneratorConfig-Objekte (wird in _update_system_overview und im Ergebnis-Tab verwendet)
-        self._generator_configs: list[GeneratorConfig] = []
+        # GeneratorConfig je Seite (Schlüssel: id(page)); wird nur für die Seite
+        # neu aufgebaut, deren Widgets sich geändert haben – siehe _refresh_page_config
+        self._generator_configs: dict[int, GeneratorConfig] = {}
+        # Generator-Seiten in Stack-Reihenfolge (spart je Schleife count()/widget(i))
+        self._generator_pages: list[GeneratorPage] = []
+        # entfernte Seiten zur Wiederverwendung (Aufbau aus der .ui ist teuer),
+        # höchstens _PAGE_POOL_MAX – der Rest wird wie bisher gelöscht
+        self._page_pool: list[GeneratorPage] = []
+
+        # Signal-Stürme (Tippen, Spin-Pfeile) nur einmal verarbeiten –
+        # siehe _schedule_map / _schedule_overview. Ein erneuter start()
+        # setzt den laufenden Timer zurück, die Arbeit passiert erst,
+        # wenn die Eingabe zur Ruhe gekommen ist.
+        self._map_timer = QtCore.QTimer(self, singleShot=True, interval=50)
+        self._map_timer.timeout.connect(self._update_map)
+        self._map_last: tuple[float, float] | None = None    # zuletzt an JS gesendet
+        self._overview_timer = QtCore.QTimer(self, singleShot=True, interval=100)
+        self._overview_timer.timeout.connect(self._update_system_overview)
         
         # ────────────────────────────────────────────────────────────────
         # Karte (Leaflet + QWebChannel) in frame_Standort_Map
         # ────────────────────────────────────────────────────────────────
-        # … innerhalb __init__ nach uic.loadUi(ui_path, self) …
+        # … innerhalb __init__ nach self.setupUi(self) …
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebChannel import QWebChannel
+
         self.map_view = QWebEngineView(self.frame_Standort_Map)
         if self.frame_Standort_Map.layout():
             self.frame_Standort_Map.layout().addWidget(self.map_view)
@@ -286,54 +698,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.map_view.page().loadFinished.connect(_on_load_finished)
 
-        # HTML der Leaflet-Karte (inkl. Klick-Handler & Layer-Control)
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8" />
-            <style>
-            html,
-            body,
-            #map {
-                height: 100%;
-                margin: 0;
-                padding: 0;
-            }
-            </style>
-            <link
-            rel="stylesheet"
-            href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
-            />
-            <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
-            <!-- qwebchannel.js aus Qt-Resource -->
-            <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
-        </head>
-        <body>
-            <div id="map"></div>
-            <script>
-            var map = L.map("map").setView([51.1657, 10.4515], 6);
-            var osm = L.tileLayer(
-                "https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png",
-                {
-                attribution: "© OpenStreetMap",
-                }
-            );
-            osm.addTo(map);
-            var marker = L.marker([51.1657, 10.4515]).addTo(map);
-
-            map.on("click", function (e) {
-                marker.setLatLng(e.latlng);
-                window.bridge.sendCoordinates(e.latlng.lat, e.latlng.lng);
-            });
-            </script>
-        </body>
-        </html>
-        """
-        self.map_view.setHtml(html, QUrl("qrc:///"))
+        # HTML der Leaflet-Karte (resources/map.html, einmal je Prozess aufgebaut)
+        self.map_view.setHtml(_map_html(), QUrl("qrc:///"))
 
         # initial zentrieren erst, wenn die Seite fertig geladen ist
-        self.map_view.page().loadFinished.connect(lambda ok: ok and self._update_map())
+        self.map_view.page().loadFinished.connect(lambda ok: ok and self._update_map(force=True))
 
         # ------------------------------------------------------------
         #   2) Menü-Einträge verbinden
@@ -353,44 +722,36 @@ class MainWindow(QtWidgets.QMainWindow):
         self._init_results_tab()
 
         # ------------------------------------------------------------
-        #   4) „Berechnen“-Button finden & verdrahten
+        #   4) „Berechnen“-Button verdrahten
         # ------------------------------------------------------------
-        for obj_name in ("pushButton_Berechnen", "btn_calc"):
-            btn = self.findChild(QtWidgets.QPushButton, obj_name)
-            if btn is not None:
-                btn.clicked.connect(self._start_calc)
-                self._btn_calc = btn          # für Enabled-Toggle merken
-                break
-        else:
-            raise RuntimeError("Berechnen-Button nicht gefunden!")
+        self._btn_calc = self.pushButton_Berechnen    # für Enabled-Toggle merken
+        self._btn_calc.clicked.connect(self._start_calc)
 
         self._worker: CalcWorker | None = None
 
         # ------------------------------------------------------------
         #   5) Ausgabefelder (Kosten) schreibgeschützt setzen
         # ------------------------------------------------------------
-        for obj_name in [
-            "doubleSpinBox_Anzeige_Hardwarekosten",
-            "doubleSpinBox_Anzeige_Installationskosten",
-            "doubleSpinBox_Anzeige_Foerderungen",
-            "doubleSpinBox_Anzeige_Gesamt",
-        ]:
-            w = self.findChild(QtWidgets.QDoubleSpinBox, obj_name)
-            if w:
-                w.setReadOnly(True)
-                w.setButtonSymbols(
-                    QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons
-                )
+        self._cost_display = (
+            self.doubleSpinBox_Anzeige_Hardwarekosten,
+            self.doubleSpinBox_Anzeige_Installationskosten,
+            self.doubleSpinBox_Anzeige_Foerderungen,
+            self.doubleSpinBox_Anzeige_Gesamt,
+        )
+        self._last_cost_tuple: tuple[float, ...] | None = None
+        for w in self._cost_display:
+            w.setReadOnly(True)
+            w.setButtonSymbols(
+                QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons
+            )
 
         # ------------------------------------------------------------
         #   6) Hardware-Comboboxen befüllen & Signale
         # ------------------------------------------------------------
         # --- NEU: Hersteller ---------------------------------------------------
-        man_names = sorted({s["manufacturer"] for s in _pv_systems if s.get("manufacturer")})
-        self.comboBox_System_Hersteller.blockSignals(True)
-        self.comboBox_System_Hersteller.clear()
-        self.comboBox_System_Hersteller.addItems(man_names)
-        self.comboBox_System_Hersteller.blockSignals(False)
+        with QtCore.QSignalBlocker(self.comboBox_System_Hersteller):
+            self.comboBox_System_Hersteller.clear()
+            self.comboBox_System_Hersteller.addItems(MANUFACTURERS)
         self.comboBox_System_Hersteller.currentIndexChanged.connect(self._on_manufacturer_change)
         
         self._populate_hardware_comboboxes()
@@ -410,34 +771,40 @@ class MainWindow(QtWidgets.QMainWindow):
         self._on_system_change()
         
         # Änderungen an den Haupt-Combo-Boxen auslösen
-        self.comboBox_System_Hersteller.currentTextChanged.connect(self._update_system_overview)
-        self.comboBox_System_PV_System .currentTextChanged.connect(self._update_system_overview)
-        self.comboBox_System_Inverter.currentTextChanged.connect(self._update_system_overview)
-
-        # Für jede bereits vorhandene Generator-Page die Spin-Boxen verbinden
-        for i in range(self.stackedWidget_Generator.count()):
-            page = self.stackedWidget_Generator.widget(i)
-            for name in ("spinBox_Modulanzahl_Generator_", "spinBox_Leistung_Generator_"):
-                sp = page.findChild(QtWidgets.QSpinBox, name)
-                if sp:
-                    sp.valueChanged.connect(self._update_system_overview)
+        self.comboBox_System_Hersteller.currentTextChanged.connect(self._schedule_overview)
+        self.comboBox_System_PV_System .currentTextChanged.connect(self._schedule_overview)
+        self.comboBox_System_Inverter.currentTextChanged.connect(self._schedule_overview)
+        # Speicher-Felder (einmalig hier, nicht je Generator-Seite)
+        self.comboBox_System_Speichertyp.currentTextChanged.connect(self._schedule_overview)
+        self.spinBox_System_Speichermodule.valueChanged.connect(self._schedule_overview)
+        self.spinBox_System_SOC_min.valueChanged.connect(self._schedule_overview)
+        self.spinBox_System_SOC_max.valueChanged.connect(self._schedule_overview)
 
         # ------------------------------------------------------------
         #   8) Live-Kosten-Anzeige – Signale verdrahten
         # ------------------------------------------------------------
-        for obj_name in [
+        self._cost_widgets = (
             # Kosten-Eingaben
-            "doubleSpinBox_Kosten_Modulkosten",
-            "doubleSpinBox_Kosten_Wechselrichter",
-            "doubleSpinBox_Kosten_Speicherkosten",
-            "doubleSpinBox_Kosten_Installationskosten",
-            "doubleSpinBox_Kosten_Foerderung",
+            self.doubleSpinBox_Kosten_Modulkosten,
+            self.doubleSpinBox_Kosten_Wechselrichter,
+            self.doubleSpinBox_Kosten_Speicherkosten,
+            self.doubleSpinBox_Kosten_Installationskosten,
+            self.doubleSpinBox_Kosten_Foerderung,
             # Speicher-Anzahl
-            "spinBox_System_Speichermodule",
-        ]:
-            w = self.findChild(QtWidgets.QAbstractSpinBox, obj_name)
-            if w:
-                w.valueChanged.connect(self._update_cost_display)
+            self.spinBox_System_Speichermodule,
+        )
+        for w in self._cost_widgets:
+            w.valueChanged.connect(self._update_cost_display)
+
+        # Verlust-Eingaben (Label → Widget) für _collect_settings
+        self._loss_widgets = (
+            ("Leitungsverluste",        self.doubleSpinBox_Verluste_Leitungsverluste),
+            ("Verschmutzung",           self.doubleSpinBox_Verluste_Verschmutzung),
+            ("Modul‑Mismatch",          self.doubleSpinBox_Verluste_Modul_Mismatch),
+            ("LID",                     self.doubleSpinBox_Verluste_LID),
+            ("Nameplate‑Toleranz",      self.doubleSpinBox_Verluste_Nameplate_Toleranz),
+            ("Alterung",                self.doubleSpinBox_Verluste_Alterung),
+        )
 
         # erste Berechnung sofort durchführen
         self._update_cost_display()
@@ -451,12 +818,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pushButton_Standort_zuKoordinaten.clicked.connect(
             self._geocode_address
         )
+        # Eigener Pool mit genau einem Thread: Nominatim erlaubt keine
+        # parallelen Anfragen, und der globale Pool bleibt frei
+        self._geocode_pool = QtCore.QThreadPool(self)
+        self._geocode_pool.setMaxThreadCount(1)
+        # Projektdateien: ein Thread, damit Speichervorgänge in Reihenfolge
+        # auf die Platte gehen
+        self._io_pool = QtCore.QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
         # Live-Karte aktualisieren, sobald sich Koordinaten ändern
-        self.doubleSpinBox_Standort_Breitengrad.valueChanged.connect(self._update_map)
-        self.doubleSpinBox_Standort_Laengengrad.valueChanged.connect(self._update_map)
-        # Nach Geocode-Aktionen auch neu zentrieren
-        self.pushButton_Standort_zuAdresse.clicked.connect(self._update_map)
-        self.pushButton_Standort_zuKoordinaten.clicked.connect(self._update_map)
+        self.doubleSpinBox_Standort_Breitengrad.valueChanged.connect(self._schedule_map)
+        self.doubleSpinBox_Standort_Laengengrad.valueChanged.connect(self._schedule_map)
+        # Geocode-Aktionen brauchen keine eigene Verbindung: _on_address_geocoded
+        # setzt die Spinboxen (Signale aktiv) und löst so valueChanged aus
 
         # ------------------------------------------------------------
         #  10) Navigations-Buttons (Tabs)
@@ -486,15 +860,11 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.listWidget_Generator.currentRowChanged.connect(
             lambda idx: self._toggle_shade_mode(
-                self.stackedWidget_Generator.widget(idx)
-                if idx >= 0 else None
+                self._generator_pages[idx]
+                if 0 <= idx < len(self._generator_pages) else None
             )
         )
 
-        # --- Template entfernen ----------------------------------------
-        self._template_page = self.stackedWidget_Generator.widget(0)
-        self.stackedWidget_Generator.removeWidget(self._template_page)
-
         self._update_generator_widgets_enabled(False)   # jetzt erst deaktivieren
 
         # ------------------------------------------------------------
@@ -513,12 +883,10 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_map_clicked(self, lat: float, lon: float) -> None:
         """Wird aufgerufen, wenn der User auf die Karte klickt."""
         # SpinBoxes setzen (ohne rekursives _update_map)
-        self.doubleSpinBox_Standort_Breitengrad.blockSignals(True)
-        self.doubleSpinBox_Standort_Laengengrad.blockSignals(True)
-        self.doubleSpinBox_Standort_Breitengrad.setValue(lat)
-        self.doubleSpinBox_Standort_Laengengrad.setValue(lon)
-        self.doubleSpinBox_Standort_Breitengrad.blockSignals(False)
-        self.doubleSpinBox_Standort_Laengengrad.blockSignals(False)
+        with QtCore.QSignalBlocker(self.doubleSpinBox_Standort_Breitengrad), \
+             QtCore.QSignalBlocker(self.doubleSpinBox_Standort_Laengengrad):
+            self.doubleSpinBox_Standort_Breitengrad.setValue(lat)
+            self.doubleSpinBox_Standort_Laengengrad.setValue(lon)
         # Karte neu zentrieren und Geocode-Buttons etc.
         self._update_map()
 
@@ -526,26 +894,22 @@ class MainWindow(QtWidgets.QMainWindow):
         man = self.comboBox_System_Hersteller.currentText()
 
         # alle Systeme des Herstellers ausser dem „generischen“
-        systems = [
-            s for s in _pv_systems
-            if s["manufacturer"] == man and s["name"].strip().lower() != man.lower()
-        ]
-
-        self.comboBox_System_PV_System.blockSignals(True)
-        self.comboBox_System_PV_System.clear()
-
-        if systems:                                  # ► mehrere Auswahl-möglichkeiten
-            for sys_obj in systems:
-                label = sys_obj["name"].removeprefix(f"{man} ").lstrip()
-                self.comboBox_System_PV_System.addItem(label, userData=sys_obj["name"])
-            self.comboBox_System_PV_System.setEnabled(True)
-        else:                                        # ► nur 1 „generisches“ System
-            # dieses eine System in die Box eintragen und die Box deaktivieren
-            gen_sys = next(s for s in _pv_systems if s["manufacturer"] == man)
-            self.comboBox_System_PV_System.addItem(gen_sys["name"], userData=gen_sys["name"])
-            self.comboBox_System_PV_System.setEnabled(False)
-
-        self.comboBox_System_PV_System.blockSignals(False)
+        man_systems = _sys_by_manufacturer.get(man, ())
+        systems = [s for s in man_systems if s["name"].strip().lower() != man.lower()]
+
+        with QtCore.QSignalBlocker(self.comboBox_System_PV_System):
+            if systems:                              # ► mehrere Auswahl-möglichkeiten
+                _fill_combo(self.comboBox_System_PV_System, [
+                    (s["name"].removeprefix(f"{man} ").lstrip(), s["name"])
+                    for s in systems
+                ])
+                self.comboBox_System_PV_System.setEnabled(True)
+            else:                                    # ► nur 1 „generisches“ System
+                # dieses eine System in die Box eintragen und die Box deaktivieren
+                gen_sys = man_systems[0]
+                _fill_combo(self.comboBox_System_PV_System,
+                            [(gen_sys["name"], gen_sys["name"])])
+                self.comboBox_System_PV_System.setEnabled(False)
 
         # nach dem Befüllen sofort abhängige Comboboxen aktualisieren
         self._on_system_change()
@@ -607,26 +971,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # --- neue Implementierung ---
         mppts: list[GeneratorConfig] = []
-        for page_idx in range(self.stackedWidget_Generator.count()):
-            page = self.stackedWidget_Generator.widget(page_idx)
-            n_mod   = page.findChild(QtWidgets.QSpinBox, "spinBox_Modulanzahl_Generator_").value()
-            conn    = page.findChild(QtWidgets.QComboBox, "comboBox_Verschaltung_Generator_").currentText().lower()
-            wp_mod  = page.findChild(QtWidgets.QSpinBox, "spinBox_Leistung_Generator_").value()
-            tilt    = page.findChild(QtWidgets.QSpinBox, "spinBox_Neigung_Generator_").value()
-            azm     = page.findChild(QtWidgets.QSpinBox, "spinBox_Azimut_Generator_").value()
-            mppt_id = page.findChild(QtWidgets.QComboBox, "comboBox_MPPT_Input").currentIndex() + 1
+        for page in self._generator_pages:
+            w       = page._w
+            n_mod   = w.n_mod.value()
+            conn    = w.conn.currentData()
+            wp_mod  = w.wp_mod.value()
+            tilt    = w.tilt.value()
+            azm     = w.azm.value()
+            mppt_id = w.mppt.currentIndex() + 1
             sh_mode = ("monatlich"
-                    if page.radioButton_Shade_Monthly.isChecked()
+                    if w.shade_mon.isChecked()
                     else "einfach")
-            sh_lvl  = page.comboBox_Shade_Level.currentText()
-            sh_mon  = {
-                m: page.findChild(QtWidgets.QSpinBox, f"spinBox_Verschattung_{_month_abbr(m)}").value()
-                for m in range(1,13)
-            }
+            sh_lvl  = w.shade_lvl.currentText()
+            sh_mon  = {m: sp.value() for m, sp in enumerate(w.shade, start=1)}
             mppts.append(GeneratorConfig(
                 mppt_index = mppt_id,
                 n_modules   = n_mod,
-                connection  = "direct" if conn.startswith("direkt") else "series",
+                connection  = conn,
                 wp_module   = wp_mod,
                 tilt_deg    = tilt,
                 azimuth_deg = azm,
@@ -636,25 +997,7 @@ class MainWindow(QtWidgets.QMainWindow):
             ))  
 
         # Verluste (%)
-        losses = {}
-        loss_candidates = (
-            ("Leitungsverluste",        "doubleSpinBox_Verluste_Leitungsverluste"),
-            ("Verschmutzung",           "doubleSpinBox_Verluste_Verschmutzung"),
-            ("Modul‑Mismatch",          "doubleSpinBox_Verluste_Modul_Mismatch"),
-            ("LID",                     "doubleSpinBox_Verluste_LID"),
-            ("Nameplate‑Toleranz",      "doubleSpinBox_Verluste_Nameplate_Toleranz"),
-            ("Alterung",                "doubleSpinBox_Verluste_Alterung"),
-        )
-        for label, obj in loss_candidates:
-            w = self.findChild(QtWidgets.QDoubleSpinBox, obj)
-            if w is not None:
-                losses[label] = w.value()
-
-        # Monats‑Verschattung
-        monthly_shade = {
-            m: self.findChild(QtWidgets.QSpinBox, f"spinBox_Verschattung_{_month_abbr(m)}").value()  # type: ignore[arg-type]
-            for m in range(1, 13)
-        }
+        losses = {label: w.value() for label, w in self._loss_widgets}
 
         settings = Settings(
             latitude=lat,
@@ -689,58 +1032,50 @@ class MainWindow(QtWidgets.QMainWindow):
     # ------------------------------------------------------------------
     def _populate_hardware_comboboxes(self) -> None:
         # PV-Systeme (Text=sys["name"], Data=sys["id"])
-        self.comboBox_System_PV_System.clear()
-        for sys in _pv_systems:
-            self.comboBox_System_PV_System.addItem(sys["name"], sys["id"])
+        _fill_combo(self.comboBox_System_PV_System, _PV_SYSTEM_ITEMS)
 
         # Inverter
-        self.comboBox_System_Inverter.clear()
-        for inv in _inverters:
-            self.comboBox_System_Inverter.addItem(inv["model"], inv["id"])
+        _fill_combo(self.comboBox_System_Inverter, _INVERTER_ITEMS)
 
         # Batterie
-        self.comboBox_System_Speichertyp.clear()
-        for bat in _batteries:
-            self.comboBox_System_Speichertyp.addItem(bat["model"], bat["id"])
+        _fill_combo(self.comboBox_System_Speichertyp, _BATTERY_ITEMS)
 
     # ------------------------------------------------------------------
     # System gewechselt  →  WR- & Batterie-Auswahl anpassen
     # ------------------------------------------------------------------
-    def _on_system_change(self) -> None:
+    def _current_system(self) -> dict:
+        """DB-Eintrag des gewählten PV-Systems ({} bei leerer/unbekannter Auswahl)."""
         key = (self.comboBox_System_PV_System.currentData()
             or self.comboBox_System_PV_System.currentText())
-        if not key:                # Liste leer → nichts zu tun
+        return _sys_by_name.get(key) or {}
+
+    def _on_system_change(self) -> None:
+        sys_obj = self._current_system()
+        if not sys_obj:            # Liste leer → nichts zu tun
             return
-        sys_obj = _sys_by_name[key]
 
         # ----- Wechselrichter‑Combobox ---------------------------------
         if sys_obj.get("inverter_integrated"):
             # integrierter WR → Combobox deaktivieren
-            self.comboBox_System_Inverter.blockSignals(True)
-            self.comboBox_System_Inverter.clear()
-            self.comboBox_System_Inverter.addItem("integriert")
-            self.comboBox_System_Inverter.setEnabled(False)
-            self.comboBox_System_Inverter.blockSignals(False)
+            with QtCore.QSignalBlocker(self.comboBox_System_Inverter):
+                _fill_combo(self.comboBox_System_Inverter, [("integriert", None)])
+                self.comboBox_System_Inverter.setEnabled(False)
         else:
             inv_ids = sys_obj.get("supported_inverter_types", [])
-            inv_models = [_inv_by_id[i]["model"] for i in inv_ids]
-            self.comboBox_System_Inverter.blockSignals(True)
-            self.comboBox_System_Inverter.setEnabled(True)
-            self.comboBox_System_Inverter.clear()
-            self.comboBox_System_Inverter.addItems(inv_models)
-            self.comboBox_System_Inverter.setCurrentIndex(0)
-            self.comboBox_System_Inverter.blockSignals(False)
+            with QtCore.QSignalBlocker(self.comboBox_System_Inverter):
+                self.comboBox_System_Inverter.setEnabled(True)
+                _fill_combo(self.comboBox_System_Inverter,
+                            [(_inv_by_id[i]["model"], None) for i in inv_ids])
+                self.comboBox_System_Inverter.setCurrentIndex(0)
 
         # ----- Batterie‑Combobox + Speicher‑Felder ---------------------
         if sys_obj.get("storage_supported"):
             batt_ids = sys_obj.get("supported_storage_types", [])
-            batt_models = [_batt_by_id[i]["model"] for i in batt_ids]
-            self.comboBox_System_Speichertyp.blockSignals(True)
-            self.comboBox_System_Speichertyp.setEnabled(True)
-            self.comboBox_System_Speichertyp.clear()
-            self.comboBox_System_Speichertyp.addItems(batt_models)
-            self.comboBox_System_Speichertyp.setCurrentIndex(0)
-            self.comboBox_System_Speichertyp.blockSignals(False)
+            with QtCore.QSignalBlocker(self.comboBox_System_Speichertyp):
+                self.comboBox_System_Speichertyp.setEnabled(True)
+                _fill_combo(self.comboBox_System_Speichertyp,
+                            [(_batt_by_id[i]["model"], None) for i in batt_ids])
+                self.comboBox_System_Speichertyp.setCurrentIndex(0)
 
             # Speicher‑Einstellungen aktivieren
             self.spinBox_System_Speichermodule.setEnabled(True)
@@ -749,11 +1084,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.checkBox_Speicheropt.setEnabled(True)
         else:
             # kein Speicher unterstützt
-            self.comboBox_System_Speichertyp.blockSignals(True)
-            self.comboBox_System_Speichertyp.clear()
-            self.comboBox_System_Speichertyp.addItem("—")
-            self.comboBox_System_Speichertyp.setEnabled(False)
-            self.comboBox_System_Speichertyp.blockSignals(False)
+            with QtCore.QSignalBlocker(self.comboBox_System_Speichertyp):
+                _fill_combo(self.comboBox_System_Speichertyp, [("—", None)])
+                self.comboBox_System_Speichertyp.setEnabled(False)
 
             self.spinBox_System_Speichermodule.setValue(0)
             self.spinBox_System_Speichermodule.setEnabled(False)
@@ -769,131 +1102,120 @@ class MainWindow(QtWidgets.QMainWindow):
     # -----------------------------------------------------------
     def _update_generator_connection_options(self, page: QtWidgets.QWidget) -> None:
         """Setzt in dieser Generator-Page die Verschaltungs-Optionen je nach Modulanzahl."""
-        spn_n = page.findChild(QtWidgets.QSpinBox, "spinBox_Modulanzahl_Generator_")
-        cb_conn = page.findChild(QtWidgets.QComboBox, "comboBox_Verschaltung_Generator_")
-        if not (spn_n and cb_conn):
-            return
+        spn_n, cb_conn = page._w.n_mod, page._w.conn
         n = spn_n.value()
-        cb_conn.blockSignals(True)
-        cb_conn.clear()
-        if n <= 1:
-            # nur 1 Modul → nur direkte Verschaltung möglich
-            cb_conn.addItem("direkt")
-            cb_conn.setEnabled(False)
-        else:
-            # >1 Module → beides erlauben
-            cb_conn.addItems(["direkt", "reihe"])
-            cb_conn.setEnabled(True)
-        cb_conn.blockSignals(False)
+        with QtCore.QSignalBlocker(cb_conn):
+            if n <= 1:
+                # nur 1 Modul → nur direkte Verschaltung möglich
+                _fill_combo(cb_conn, _CONN_ITEMS_SINGLE)
+                cb_conn.setEnabled(False)
+            else:
+                # >1 Module → beides erlauben
+                _fill_combo(cb_conn, _CONN_ITEMS)
+                cb_conn.setEnabled(True)
     # ──── BLOCK B · START ───────────────────────────────────────────────
     def _add_generator_page(self) -> None:
-        """Erzeugt eine neue Generator-Seite + List-Eintrag."""
-        ui_gen = Path(__file__).resolve().parent.parent / "ui" / "pv_generator_page.ui"
-        page   = uic.loadUi(ui_gen)                     # Seite laden
-        
-        # --- Visualisierungs-Widgets verdrahten ---
-        # Neigungs-Frame (seitliche Ansicht)
-        from gui.widgets import TiltWidget, AzimuthWidget
-        tilt_frame: TiltWidget = page.findChild(TiltWidget, "frame_neigung")
-        spin_tilt = page.findChild(QtWidgets.QSpinBox, "spinBox_Neigung_Generator_")
-        if tilt_frame and spin_tilt:
-            spin_tilt.valueChanged.connect(tilt_frame.setAngle)
-            # Initialwert setzen
-            tilt_frame.setAngle(spin_tilt.value())
-
-        # Azimut-Frame (Draufsicht)
-        azi_frame: AzimuthWidget = page.findChild(AzimuthWidget, "frame_azimut")
-        spin_azi = page.findChild(QtWidgets.QSpinBox, "spinBox_Azimut_Generator_")
-        if azi_frame and spin_azi:
-            spin_azi.valueChanged.connect(azi_frame.setAzimuth)
-            # Initialwert setzen
-            azi_frame.setAzimuth(spin_azi.value())
+        """Erzeugt eine neue Generator-Seite + List-Eintrag. Eine zuvor
+        entfernte Seite aus dem Seiten-Pool wird bevorzugt wiederverwendet."""
+        if self._page_pool:
+            page = self._page_pool.pop()
+            page.reset()
+        else:
+            page = self._create_generator_page()
+        w = page._w                                     # gemerkte Widgets der Seite
 
-        # ────────────────────────────────────────────────────────────────
-        # 1) MPPT-Eingänge füllen
-        # ---------------------------------------------------------------
-        # aktuellen Wechselrichter auslesen und über _inv_by_model finden
-        inv_model = self.comboBox_System_Inverter.currentText()
-        inv = _inv_by_model.get(inv_model, {})
-        # angenommen in deinem JSON heißt das Feld "mppt_inputs" oder ähnlich
-        mppt_count = inv.get("mppt_inputs", 1)
-        cb_mppt = page.findChild(QtWidgets.QComboBox, "comboBox_MPPT_Input")
-        cb_mppt.clear()
-        # Einträge "1", "2", ... bis mppt_count
-        for i in range(1, mppt_count + 1):
-            cb_mppt.addItem(str(i))
+        # Visualisierungs-Widgets auf die Spinbox-Werte setzen
+        w.tilt_frame.setAngle(w.tilt.value())
+        w.azm_frame.setAzimuth(w.azm.value())
 
-        # ────────────────────────────────────────────────────────────────
-        # 2) Schattierungs­level füllen
-        # ---------------------------------------------------------------
-        # nur für den Modus "Einfach" relevant
-        cb_shade = page.findChild(QtWidgets.QComboBox, "comboBox_Shade_Level")
-        cb_shade.clear()
-        cb_shade.addItems(["keine", "leicht", "mittel", "stark"])
+        # (MPPT-Eingänge werden unten per _rebuild_mppt_fields gefüllt)
 
-        # ────────────────────────────────────────────────────────────────
-        # 2a) Verschaltungs-Optionen je nach Modulanzahl setzen
-        # ---------------------------------------------------------------
+        # Verschaltungs-Optionen je nach Modulanzahl setzen
         self._update_generator_connection_options(page)
-        # Modul-Spinbox ändert Verschaltung und Übersicht
-        spn_n = page.findChild(QtWidgets.QSpinBox, "spinBox_Modulanzahl_Generator_")
-        if spn_n:
-            spn_n.valueChanged.connect(lambda val, p=page: (
-                self._update_generator_connection_options(p),
-                self._update_system_overview()
-            ))
-
-        # Leistung-Spinbox → Übersicht
-        spn_wp = page.findChild(QtWidgets.QSpinBox, "spinBox_Leistung_Generator_")
-        if spn_wp:
-            spn_wp.valueChanged.connect(self._update_system_overview)
-
-        # MPPT-Auswahl → Übersicht
-        cb_mppt = page.findChild(QtWidgets.QComboBox, "comboBox_MPPT_Input")
-        if cb_mppt:
-            cb_mppt.currentIndexChanged.connect(self._update_system_overview)
-
-        # Verschaltung → Übersicht
-        cb_conn = page.findChild(QtWidgets.QComboBox, "comboBox_Verschaltung_Generator_")
-        if cb_conn:
-            cb_conn.currentIndexChanged.connect(self._update_system_overview)
-            
-        self.comboBox_System_Speichertyp.currentTextChanged.connect(self._update_system_overview)
-        self.spinBox_System_Speichermodule.valueChanged.connect(self._update_system_overview)
-        self.spinBox_System_SOC_min.valueChanged.connect(self._update_system_overview)
-        self.spinBox_System_SOC_max.valueChanged.connect(self._update_system_overview)
-        # ────────────────────────────────────────────────────────────────
-        # Rest deiner Methode
-        # ---------------------------------------------------------------
+
         self.stackedWidget_Generator.addWidget(page)
+        self._generator_pages.append(page)
 
-        idx = self.stackedWidget_Generator.count() - 1
+        idx = len(self._generator_pages) - 1
         self.listWidget_Generator.addItem(f"Generator {idx+1}")
         self.listWidget_Generator.setCurrentRow(idx)
 
         # Generator-Bereich wieder aktivieren
         self._update_generator_widgets_enabled(True)
 
+        # Shade-Status + MPPT-Felder initial anpassen; _rebuild_mppt_fields
+        # legt dabei auch die Config der Seite an und stößt die Übersicht an
+        # (beim Projekt-Laden nur einmal für alle Seiten)
+        self._toggle_shade_mode(page)
+        self._rebuild_mppt_fields(self._current_system(), (page,))
+
+    def _create_generator_page(self) -> GeneratorPage:
+        """Baut eine Seite aus der .ui und verdrahtet ihre Signale (einmalig
+        je Seite – auch über Wiederverwendung aus dem Seiten-Pool hinweg)."""
+        page = GeneratorPage()                          # Seite erzeugen
+        w = page._w
+
+        # --- Visualisierungs-Widgets verdrahten ---
+        # Neigungs-Frame (seitliche Ansicht)
+        tilt_frame: TiltWidget = w.tilt_frame
+        w.tilt.valueChanged.connect(tilt_frame.setAngle)
+        # Azimut-Frame (Draufsicht)
+        azi_frame: AzimuthWidget = w.azm_frame
+        w.azm.valueChanged.connect(azi_frame.setAzimuth)
+
+        # ────────────────────────────────────────────────────────────────
+        # Schattierungs­level füllen
+        # ---------------------------------------------------------------
+        # nur für den Modus "Einfach" relevant
+        _fill_combo(w.shade_lvl, _SHADE_LVL_ITEMS)
+
+        # Modul-Spinbox ändert Verschaltung und Übersicht
+        w.n_mod.valueChanged.connect(self._on_page_module_count_changed)
+
+        # Leistung, MPPT-Auswahl, Verschaltung, Neigung, Azimut → nur diese Seite
+        # (gemeinsame Slots, die Seite wird über sender() ermittelt)
+        w.wp_mod.valueChanged.connect(self._on_page_value_changed)
+        w.mppt.currentIndexChanged.connect(self._on_page_value_changed)
+        w.conn.currentIndexChanged.connect(self._on_page_value_changed)
+        w.tilt.valueChanged.connect(self._on_page_value_changed)
+        w.azm.valueChanged.connect(self._on_page_value_changed)
+
         # Radio-Buttons verdrahten
-        page.radioButton_Shade_Simple.toggled.connect(
-            lambda *_: self._toggle_shade_mode(page)
-        )
-        page.radioButton_Shade_Monthly.toggled.connect(
-            lambda *_: self._toggle_shade_mode(page)
-        )
+        page.radioButton_Shade_Simple.toggled.connect(self._on_page_shade_toggled)
+        page.radioButton_Shade_Monthly.toggled.connect(self._on_page_shade_toggled)
+        return page
+
+    def _release_generator_page(self, page: GeneratorPage) -> None:
+        """Nimmt die Seite aus dem Stack und legt sie in den Seiten-Pool.
+        Ist der Pool voll, wird die Seite gelöscht."""
+        self._generator_configs.pop(id(page), None)
+        self.stackedWidget_Generator.removeWidget(page)
+        if len(self._page_pool) < _PAGE_POOL_MAX:
+            page.setParent(None)            # nicht mehr am Stack hängen lassen
+            self._page_pool.append(page)
+        else:
+            page.deleteLater()              # trennt auch alle Seiten-Verbindungen
 
-        # MPPT-Felder & Shade-Status initial anpassen
-        self._rebuild_mppt_fields_current_page(page)
-        self._toggle_shade_mode(page)
-        
-        # Spin-Boxen der neuen Seite verbinden
-        for name in ("spinBox_Modulanzahl_Generator_", "spinBox_Leistung_Generator_"):
-            sp = page.findChild(QtWidgets.QSpinBox, name)
-            if sp:
-                sp.valueChanged.connect(self._update_system_overview)
+    # -----------------------------------------------------------
+    # Slots der Generator-Seiten (für alle Seiten gemeinsam)
+    # -----------------------------------------------------------
+    def _sender_page(self) -> GeneratorPage:
+        """Generator-Seite, zu der das signalgebende Widget gehört."""
+        w = self.sender()
+        while not isinstance(w, GeneratorPage):
+            w = w.parent()
+        return w
+
+    def _on_page_module_count_changed(self, *_) -> None:
+        page = self._sender_page()
+        self._update_generator_connection_options(page)
+        self._refresh_page_config(page)
 
-        # Übersicht sofort einmal aktualisieren
-        self._update_system_overview()
+    def _on_page_value_changed(self, *_) -> None:
+        self._refresh_page_config(self._sender_page())
+
+    def _on_page_shade_toggled(self, *_) -> None:
+        self._toggle_shade_mode(self._sender_page())
 
     def _toggle_shade_mode(self, page: QtWidgets.QWidget | None) -> None:
         """
@@ -904,48 +1226,37 @@ class MainWindow(QtWidgets.QMainWindow):
             return                                    # z. B. wenn Liste leer ist
 
         simple = page.radioButton_Shade_Simple.isChecked()
-        page.comboBox_Shade_Level.setEnabled(simple)
-
-        for m in range(1, 13):
-            sp = page.findChild(QtWidgets.QSpinBox,
-                                f"spinBox_Verschattung_{_month_abbr(m)}")
-            if sp:
-                sp.setEnabled(not simple)
-
-    def _rebuild_mppt_fields_current_page(self, page: QtWidgets.QWidget) -> None:
-        """
-        Füllt *in dieser Generator-Page* die MPPT-Combobox anhand der
-        aktuell gewählten Wechselrichter-/System-Daten.
-        """
-        # Wie viele MPPT-Eingänge sind verfügbar?
-        key = (self.comboBox_System_PV_System.currentData()
-            or self.comboBox_System_PV_System.currentText())
-        sys_obj = _sys_by_name[key]
-
-        if sys_obj.get("inverter_integrated"):
-            n_mppt = sys_obj.get("mppt_inputs", 1)
-        else:
-            inv_model = self.comboBox_System_Inverter.currentText()
-            inv_obj   = _inv_by_model.get(inv_model, {})
-            n_mppt     = inv_obj.get("mppt_inputs", 1)
-
-        # Combobox in der Page suchen und befüllen
-        box = page.findChild(QtWidgets.QComboBox, "comboBox_MPPT_Input")
-        if box:
-            box.blockSignals(True)
-            box.clear()
-            box.addItems([str(i) for i in range(1, n_mppt + 1)])
-            box.setCurrentIndex(0)
-            box.blockSignals(False)
+        # beide Radio-Buttons feuern toggled → zweiter Aufruf ändert nichts
+        if getattr(page, "_shade_simple", None) is simple:
+            return
+        page._shade_simple = simple
+        page._w.shade_lvl.setEnabled(simple)
+
+        for sp in page._w.shade:
+            sp.setEnabled(not simple)
+
+    def _refresh_page_config(self, page: QtWidgets.QWidget) -> None:
+        """Baut die GeneratorConfig *nur dieser* Seite aus ihren Widgets neu
+        auf und stößt die (entprellte) Übersicht an."""
+        w = page._w
+        self._generator_configs[id(page)] = GeneratorConfig(
+            mppt_index   = w.mppt.currentIndex() + 1,
+            n_modules    = w.n_mod.value(),
+            connection   = w.conn.currentData(),
+            wp_module    = w.wp_mod.value(),
+            tilt_deg     = w.tilt.value(),
+            azimuth_deg  = w.azm.value(),
+        )
+        self._schedule_overview()
 
     def _remove_current_generator(self) -> None:
         row = self.listWidget_Generator.currentRow()
+        if row < 0:
+            return
         if row == 0:
             QMessageBox.warning(self, "Löschen", "Generator 1 kann nicht gelöscht werden.")
             return
-        self.stackedWidget_Generator.removeWidget(
-            self.stackedWidget_Generator.widget(row)
-        )
+        self._release_generator_page(self._generator_pages.pop(row))
         self.listWidget_Generator.takeItem(row)
 
         # Reihen neu durchnummerieren
@@ -955,10 +1266,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Auswahl korrigieren
         self.listWidget_Generator.setCurrentRow(max(0, row-1))
         self._update_generator_widgets_enabled(
-            self.stackedWidget_Generator.count() > 0
+            bool(self._generator_pages)
         )
         
-        self._update_system_overview()
+        self._schedule_overview()
         return
 
     def _update_generator_widgets_enabled(self, enable: bool) -> None:
@@ -970,20 +1281,20 @@ class MainWindow(QtWidgets.QMainWindow):
     # Nur MPPT-Zahl aktualisieren, falls externer WR geändert wird
     # ------------------------------------------------------------------
     def _on_inverter_change(self) -> None:
-        key = (self.comboBox_System_PV_System.currentData()
-            or self.comboBox_System_PV_System.currentText())
-        sys_obj = _sys_by_name[key]
-        if not sys_obj.get("inverter_integrated"):
+        sys_obj = self._current_system()
+        if sys_obj and not sys_obj.get("inverter_integrated"):
             self._rebuild_mppt_fields(sys_obj)
 
     # ------------------------------------------------------------------
     # MPPT‑Widgets für nicht benötigte Tracker deaktivieren
     # ------------------------------------------------------------------
-    def _rebuild_mppt_fields(self, sys_obj) -> None:
-        """Aktiviert genau so viele MPPT‑Zeilen, wie das System benötigt."""
+    def _rebuild_mppt_fields(self, sys_obj, pages: Sequence[QtWidgets.QWidget] | None = None) -> None:
+        """Aktiviert genau so viele MPPT‑Zeilen, wie das System benötigt, und
+        füllt die MPPT-Combobox der *pages* (Standard: alle Generator-Seiten)."""
+        if pages is None:
+            pages = self._generator_pages
         # ▶ Guard: nichts tun, wenn noch kein Generator-Page existiert
-        current = self.stackedWidget_Generator.currentWidget()
-        if current is None:
+        if not pages:
             return
         
         if sys_obj.get("inverter_integrated"):
@@ -995,103 +1306,104 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Alle Spinboxen & Labels, die zu einem MPPT gehören, heißen
         #  spinBox_PV_Generator_MPPT<i>_…   bzw.   …_Module_2 (UI‑Tippfehler)
-        for i in range(1, 5):
+        # (einmalig in GeneratorPage._mppt_spins bzw. self._mppt_extra einsortiert)
+        for i, extra in self._mppt_extra.items():
             enabled = i <= n_mppt
-            # jede SpinBox innerhalb des Frames inspizieren
-            #for sp in self.findChildren(QtWidgets.QSpinBox):
-            for sp in current.findChildren(QtWidgets.QSpinBox):
-                if f"_MPPT{i}_" in sp.objectName():
+            for page in pages:
+                for sp in page._mppt_spins.get(i, ()):
                     sp.setEnabled(enabled)
                     if not enabled:
-                        sp.setValue(0)            # verhindert ungewollte Modul‑Einträge
-            # Tippfehler‑Variante für Modul‑SpinBox von MPPT 2
-            weird = self.findChild(QtWidgets.QSpinBox, f"spinBox_PV_Generator_MPPT1_Module_{i}")
-            if weird:
-                weird.setEnabled(enabled)
-            # Label ebenso
-            lbl = self.findChild(QtWidgets.QLabel, f"label_PV_Generator_MPPT{i}")
-            if lbl:
-                lbl.setEnabled(enabled)
-
-        # --- NEU: über alle Pages laufen -------------------------------
-        for page_idx in range(self.stackedWidget_Generator.count()):
-            page = self.stackedWidget_Generator.widget(page_idx)
+                        sp.setValue(0)        # verhindert ungewollte Modul‑Einträge
+            # Tippfehler‑Variante für Modul‑SpinBox von MPPT 2 + Label ebenso
+            for w in extra:
+                w.setEnabled(enabled)
 
+        for page in pages:
             # neue eindeutige MPPT-Combobox
-            box = page.findChild(QtWidgets.QComboBox, "comboBox_MPPT_Input")
-            if box:
-                box.blockSignals(True)
-                box.clear()
-                box.addItems([str(i) for i in range(1, n_mppt + 1)])
+            box = page._w.mppt
+            with QtCore.QSignalBlocker(box):
+                _fill_combo(box, [(str(i), None) for i in range(1, n_mppt + 1)])
                 box.setCurrentIndex(0)
-                box.blockSignals(False)
+            self._refresh_page_config(page)     # MPPT-Index ohne Signal geändert
         
     # ------------------------------------------------------------------
     # Koordinaten  →  Adresse
     # ------------------------------------------------------------------
     def _reverse_geocode(self) -> None:
         # alle bisherigen Adressfelder leeren
-        for name in ("lineEdit_Standort_Land",
-                    "lineEdit_Standort_PLZ",
-                    "lineEdit_Standort_Ort",
-                    "lineEdit_Standort_Strasse",
-                    "lineEdit_Standort_Hausnummer"):
-            le = self.findChild(QtWidgets.QLineEdit, name)
-            if le:
-                le.clear()
-
-        # dann wie gewohnt reverse geocoden
-        try:
-            lat = self.doubleSpinBox_Standort_Breitengrad.value()
-            lon = self.doubleSpinBox_Standort_Laengengrad.value()
-            r = requests.get(
-                "https://nominatim.openstreetmap.org/reverse",
-                params={"lat": lat, "lon": lon, "format": "json"},
-                headers=HEADERS, timeout=8,
-            )
-            r.raise_for_status()
-            data = r.json().get("address", {})
-        except Exception as exc:
-            QtWidgets.QMessageBox.warning(self, "Reverse Geocoding", str(exc))
-            return
+        for le in (self.lineEdit_Standort_Land,
+                   self.lineEdit_Standort_PLZ,
+                   self.lineEdit_Standort_Ort,
+                   self.lineEdit_Standort_Strasse,
+                   self.lineEdit_Standort_Hausnummer):
+            le.clear()
+
+        # dann reverse geocoden – Anfrage läuft im Thread-Pool
+        lat = self.doubleSpinBox_Standort_Breitengrad.value()
+        lon = self.doubleSpinBox_Standort_Laengengrad.value()
+        self._start_geocode(
+            _nominatim_reverse, (round(lat, 5), round(lon, 5)),
+            self._on_reverse_geocoded, self._on_reverse_geocode_failed,
+        )
 
-        # Felder nur überschreiben, wenn leer
-        def _set(le_name: str, val: str) -> None:
-            le: QtWidgets.QLineEdit = self.findChild(QtWidgets.QLineEdit, le_name)  # type: ignore
-            if le:
-                le.setText(val)
+    def _on_reverse_geocode_failed(self, msg: str) -> None:
+        self._set_geocode_buttons_enabled(True)
+        QtWidgets.QMessageBox.warning(self, "Reverse Geocoding", msg)
 
-        _set("lineEdit_Standort_Land",       data.get("country", ""))
-        _set("lineEdit_Standort_PLZ",        data.get("postcode", ""))
-        _set("lineEdit_Standort_Ort",        data.get("city") or data.get("town") or data.get("village", ""))
-        _set("lineEdit_Standort_Strasse",    data.get("road", ""))
-        _set("lineEdit_Standort_Hausnummer", data.get("house_number", ""))
+    def _on_reverse_geocoded(self, result: dict) -> None:
+        self._set_geocode_buttons_enabled(True)
+        data = result.get("address", {})
+
+        # Felder nur überschreiben, wenn leer
+        self.lineEdit_Standort_Land.setText(data.get("country", ""))
+        self.lineEdit_Standort_PLZ.setText(data.get("postcode", ""))
+        self.lineEdit_Standort_Ort.setText(data.get("city") or data.get("town") or data.get("village", ""))
+        self.lineEdit_Standort_Strasse.setText(data.get("road", ""))
+        self.lineEdit_Standort_Hausnummer.setText(data.get("house_number", ""))
 
     # ------------------------------------------------------------------
     # Adresse  →  Koordinaten
     # ------------------------------------------------------------------
     def _geocode_address(self) -> None:
         street = f"{self.lineEdit_Standort_Hausnummer.text().strip()} {self.lineEdit_Standort_Strasse.text().strip()}".strip()
-        params = {
-            "street":      street,
-            "city":        self.lineEdit_Standort_Ort.text(),
-            "postalcode":  self.lineEdit_Standort_PLZ.text(),
-            "country":     self.lineEdit_Standort_Land.text(),
-            "format":      "json",
-            "limit":       1,
-        }
-        try:
-            r = requests.get("https://nominatim.openstreetmap.org/search",
-                             params=params, headers=HEADERS, timeout=8)
-            r.raise_for_status()
-            data = r.json()
-            if not data:
-                raise ValueError("keine Treffer")
-            lat, lon = float(data[0]["lat"]), float(data[0]["lon"])
-            self.doubleSpinBox_Standort_Breitengrad.setValue(lat)
-            self.doubleSpinBox_Standort_Laengengrad.setValue(lon)
-        except Exception as exc:
-            QtWidgets.QMessageBox.warning(self, "Geocoding", f"Adresse nicht gefunden:\n{exc}")
+        args = (
+            street,
+            self.lineEdit_Standort_Ort.text(),
+            self.lineEdit_Standort_PLZ.text(),
+            self.lineEdit_Standort_Land.text(),
+        )
+        self._start_geocode(_nominatim_search, args,
+                            self._on_address_geocoded, self._on_geocode_failed)
+
+    def _on_geocode_failed(self, msg: str) -> None:
+        self._set_geocode_buttons_enabled(True)
+        QtWidgets.QMessageBox.warning(self, "Geocoding", f"Adresse nicht gefunden:\n{msg}")
+
+    def _on_address_geocoded(self, data: list) -> None:
+        if not data:
+            self._on_geocode_failed("keine Treffer")
+            return
+        self._set_geocode_buttons_enabled(True)
+        lat, lon = float(data[0]["lat"]), float(data[0]["lon"])
+        self.doubleSpinBox_Standort_Breitengrad.setValue(lat)
+        self.doubleSpinBox_Standort_Laengengrad.setValue(lon)
+
+    # ------------------------------------------------------------------
+    # Geocoding-Hilfen (Thread-Pool)
+    # ------------------------------------------------------------------
+    def _start_geocode(self, fetch, args: tuple, on_done, on_fail) -> None:
+        """Startet *fetch(*args)* im Geocoding-Pool; *on_done*/*on_fail*
+        müssen Methoden von self sein, damit sie im GUI-Thread laufen."""
+        self._set_geocode_buttons_enabled(False)
+        task = _BackgroundTask(fetch, *args)
+        task.signals.finished.connect(on_done)
+        task.signals.failed.connect(on_fail)
+        self._geocode_task = task           # Signale am Leben halten
+        self._geocode_pool.start(task)
+
+    def _set_geocode_buttons_enabled(self, enable: bool) -> None:
+        self.pushButton_Standort_zuAdresse.setEnabled(enable)
+        self.pushButton_Standort_zuKoordinaten.setEnabled(enable)
 
     # ------------------------------------------------------------------
     #   Live-Kosten-Anzeige
@@ -1111,23 +1423,25 @@ class MainWindow(QtWidgets.QMainWindow):
         hw_total  = mod_cost + wr_cost + bat_cost
         grand_tot = hw_total + inst_cost - subsidy
 
-        self.doubleSpinBox_Anzeige_Hardwarekosten.setValue(hw_total)
-        self.doubleSpinBox_Anzeige_Installationskosten.setValue(inst_cost)
-        self.doubleSpinBox_Anzeige_Foerderungen.setValue(subsidy)
-        self.doubleSpinBox_Anzeige_Gesamt.setValue(grand_tot)
+        # unveränderte Summen → Anzeige nicht anfassen
+        costs = (hw_total, inst_cost, subsidy, grand_tot)
+        if costs == self._last_cost_tuple:
+            return
+        self._last_cost_tuple = costs
+
+        # reine Anzeige – keine valueChanged-Kaskade auslösen
+        for sp, value in zip(self._cost_display, costs):
+            with QtCore.QSignalBlocker(sp):
+                sp.setValue(value)
 
-    # ------------------------------------------------------------------
-    # Ergebnis‑Tab initialisieren
-    # ------------------------------------------------------------------
-    def _populate_manufacturer_box(self) -> None:
-        """Füllt comboBox_System_Hersteller mit allen distinct‑Herstellern."""
-        manufacturers = sorted({s["manufacturer"] for s in _pv_systems})
-        self.comboBox_System_Hersteller.clear()
-        self.comboBox_System_Hersteller.addItems(manufacturers)
-    
     # -------------------------------------------------------------------
     # System-Übersicht aktualisieren  (Anlage- & Ergebnis-Tab)
     # -------------------------------------------------------------------
+    def _schedule_overview(self, *_) -> None:
+        """Fasst schnell aufeinanderfolgende Änderungen zu einem
+        `_update_system_overview` zusammen (100 ms nach der letzten)."""
+        self._overview_timer.start()
+
     def _update_system_overview(self) -> None:
         # ------------------------------------------------------------
         # 0) Grundobjekte laden (System- & Wechselrichter-Dicts)
@@ -1152,59 +1466,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.label_StringConfig_MPPT_Inputs_Text.setText(f"{n_mppt} Eingänge")
 
         # ------------------------------------------------------------
-        # 2) Generator-Infos einsammeln  +  self._generator_configs füllen
+        # 2) Generator-Infos aus den gemerkten Configs zusammenfassen
         # ------------------------------------------------------------
         mppt_map: dict[int, list[str]] = {i: [] for i in range(1, n_mppt + 1)}
-        self._generator_configs = []          # ← vor jedem Durchlauf neu aufbauen
 
         total_modules = 0
         total_power   = 0            # Wp gesamt
 
-        for idx in range(self.stackedWidget_Generator.count()):
-            page = self.stackedWidget_Generator.widget(idx)
-
-            # ---------- Widgets sicher finden ------------------------
-            spn_n  = page.findChild(QtWidgets.QSpinBox,
-                                    "spinBox_Modulanzahl_Generator_")
-            spn_wp = page.findChild(QtWidgets.QSpinBox,
-                                    "spinBox_Leistung_Generator_")
-            if spn_n is None or spn_wp is None:
-                # Seite ist noch ein Platzhalter ohne Eingabefelder → überspringen
+        for idx, page in enumerate(self._generator_pages):
+            cfg  = self._generator_configs.get(id(page))
+            if cfg is None:
                 continue
 
-            n_mod  = spn_n.value()
-            wp_mod = spn_wp.value()
-
-            tilt = page.findChild(QtWidgets.QSpinBox,
-                                "spinBox_Neigung_Generator_")
-            azm  = page.findChild(QtWidgets.QSpinBox,
-                                "spinBox_Azimut_Generator_")
-            cb_conn = page.findChild(QtWidgets.QComboBox,
-                                    "comboBox_Verschaltung_Generator_")
-            cb_mppt = page.findChild(QtWidgets.QComboBox,
-                                    "comboBox_MPPT_Input")
-
             # ---------- Summen & Anzeige-Text ------------------------
-            total_modules += n_mod
-            total_power   += n_mod * wp_mod
-
-            conn_txt = cb_conn.currentText().capitalize() if cb_conn else "Direkt"
-            mppt_id  = (cb_mppt.currentIndex() + 1) if cb_mppt else 1
-
-            mppt_map.setdefault(mppt_id, []).append(
-                f"Generator {idx+1}: {n_mod}×{wp_mod} Wp ({conn_txt})"
-            )
+            total_modules += cfg.n_modules
+            total_power   += cfg.n_modules * cfg.wp_module
 
-            # ---------- GeneratorConfig für Wirkungsgrad -------------
-            self._generator_configs.append(
-                GeneratorConfig(
-                    mppt_index   = mppt_id,
-                    n_modules    = n_mod,
-                    connection   = "direct" if conn_txt.lower().startswith("direkt") else "series",
-                    wp_module    = wp_mod,
-                    tilt_deg     = tilt.value() if tilt else 35,
-                    azimuth_deg  = azm.value()  if azm  else 0,
-                )
+            conn_txt = "Direkt" if cfg.connection == "direct" else "Reihe"
+            mppt_map.setdefault(cfg.mppt_index, []).append(
+                f"Generator {idx+1}: {cfg.n_modules}×{cfg.wp_module} Wp ({conn_txt})"
             )
 
         # ------------------------------------------------------------
@@ -1236,14 +1516,8 @@ class MainWindow(QtWidgets.QMainWindow):
         batt_model = self.comboBox_System_Speichertyp.currentText().strip()
         batt_count = self.spinBox_System_Speichermodule.value()
 
+        # (Mitgliedstest im Modell-Index reicht – das Label braucht keine Specs)
         if batt_model in _batt_by_model and batt_count > 0:
-            specs = get_battery_spec(batt_model)
-
-            brutto_wh = batt_count * specs["capacity_wh"]
-            soc_min = self.spinBox_System_SOC_min.value() / 100
-            soc_max = self.spinBox_System_SOC_max.value() / 100
-            netto_wh = brutto_wh * (soc_max - soc_min)
-
             self.label_Ergebnis_Speichertyp_Text.setText(
                 f"{batt_count}× {batt_model}"
             )
@@ -1254,16 +1528,21 @@ class MainWindow(QtWidgets.QMainWindow):
     # ------------------------------------------------------------------
     # OSM-Karte aktualisieren
     # ------------------------------------------------------------------
-    def _update_map(self) -> None:
-        """Zentriert Karte und Marker auf die aktuellen Koordinaten."""
-        lat = self.doubleSpinBox_Standort_Breitengrad.value()
-        lon = self.doubleSpinBox_Standort_Laengengrad.value()
-        js = (
-            f"marker.setLatLng([{lat}, {lon}]);"
-            f"map.setView([{lat}, {lon}], map.getZoom());"
-        )
+    def _schedule_map(self, *_) -> None:
+        """Fasst Koordinaten-Änderungen zu einem `_update_map` zusammen
+        (50 ms nach der letzten)."""
+        self._map_timer.start()
+
+    def _update_map(self, force: bool = False) -> None:
+        """Zentriert Karte und Marker auf die aktuellen Koordinaten
+        (kein JS-Aufruf, wenn sie sich seit dem letzten Mal nicht geändert haben)."""
+        pos = (self.doubleSpinBox_Standort_Breitengrad.value(),
+               self.doubleSpinBox_Standort_Laengengrad.value())
+        if pos == self._map_last and not force:
+            return
+        self._map_last = pos
         # führt das JavaScript in der WebEngine aus
-        self.map_view.page().runJavaScript(js)
+        self.map_view.page().runJavaScript(_MAP_JS.format(lat=pos[0], lon=pos[1]))
                        
     # ------------------------------------------------------------------
     # Simulation starten
@@ -1281,12 +1560,8 @@ class MainWindow(QtWidgets.QMainWindow):
         calc_logger.debug("Button 'Berechnen' gedrückt – beginne Berechnung")
 
         # ─────────────────────────────────────────────────
-        #   Jetzt den „Bitte warten“-Dialog anlegen & zeigen
+        #   „Bitte warten“-Dialog (einmalig in _init_results_tab angelegt) zeigen
         # ─────────────────────────────────────────────────
-        self._wait_dialog = QProgressDialog("Berechnung läuft…", "", 0, 0, self)
-        self._wait_dialog.setWindowTitle("Bitte warten")
-        self._wait_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
-        self._wait_dialog.setCancelButton(None)
         self._wait_dialog.show()
         
         self._btn_calc.setEnabled(False)
@@ -1307,12 +1582,6 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_result(self, res_all: dict[int, dict]) -> None:
         # Dialog schließen
         self._wait_dialog.hide()
-        res = res_all[0]
-        if "loss_total_percent" in res:
-            #self.label_Ergebnis_Verluste_Text.setText(f"{res['loss_total_percent']:.1f} %")
-            sys_loss = res_all[0].get("user_system_loss_pct", 0.0)
-            tmp_loss = res_all[0].get("internal_losses_pct", {}).get("TempLow", 0.0)
-            opt_loss = res_all[0].get("internal_losses_pct", {}).get("OptWR", 0.0)
 
         # --- 1) konsolenfreundliche Ausgabe ---------------------------
         # print("\n" + "=" * 60)
@@ -1327,30 +1596,29 @@ class MainWindow(QtWidgets.QMainWindow):
         # -------------------------------------------------------------
         #  Speicher-Optimierung anzeigen
         # -------------------------------------------------------------
-        disabled = []
-        for u in self._scenario_units:
-            if u and res_all[u].get("disabled_months"):
-                disabled = res_all[u]["disabled_months"]
-                break
+        chart = self._prepare_chart_data(res_all)
+        disabled = chart["disabled"]
 
-        self.label_Ergebnis_Speicheropt.setText(_disabled_label(disabled))
+        self.label_Ergebnis_Speicheropt.setText(
+            _disabled_label(tuple(sorted(set(disabled))))
+        )
 
-        # Diagramm zeichnen (disabled-Monate übergeben)
-        self._plot_result_chart(res_all, disabled_months=disabled)
+        # Diagramm merken – gezeichnet wird erst, wenn der Ergebnis-Reiter
+        # sichtbar ist (siehe _replot_if_visible)
+        self._chart_pending = chart
 
         # ––– Tabelle befüllen ––––––––––––––––––––––––––––––––––––––––
-        rows = []
+        units_list = self._scenario_units
+        # Wertspalte je Szenario: ohne Speicher Spalte 1, mit Speicher Spalte 2
+        col_idx = [1 if u == 0 else 2 for u in units_list]
 
         def _merge_rows(key: str) -> list[tuple[str, list[str]]]:
-            labels = [r[0] for r in next(iter(res_all.values()))[key]]
-            merged = []
-            for idx, lbl in enumerate(labels):
-                vals = []
-                for units in self._scenario_units:
-                    row = res_all[units][key][idx]
-                    vals.append(row[1] if units == 0 else row[2])
-                merged.append((lbl, vals))
-            return merged
+            # Zeilenliste je Szenario einmal holen statt je Label neu
+            per_scn = [res_all[u][key] for u in units_list]
+            return [
+                (row0[0], [scn_rows[i][c] for scn_rows, c in zip(per_scn, col_idx)])
+                for i, row0 in enumerate(per_scn[0])
+            ]
 
         # Abschnitts-Überschriften als Leerzeilen einfügen
         sections = [
@@ -1362,34 +1630,43 @@ class MainWindow(QtWidgets.QMainWindow):
             ("Verluste",            _merge_rows("rows_loss")),
         ]
 
-        self._model_res.setRowCount(0)
-        bold = QFont(); bold.setBold(True)
+        # Zellen in einem Rutsch aufbauen (None = leere Zelle)
+        n_rows = sum(len(block) + 2 for _, block in sections)
+        data = np.empty((n_rows, self._model_res.columnCount()), dtype=object)
+        bold_rows = np.zeros(n_rows, dtype=bool)
 
+        r = 0
         for title, block in sections:
             # Überschrift
-            hdr = [QStandardItem(title)]
-            hdr[0].setFont(bold)
-            self._model_res.appendRow(hdr)
+            data[r, 0] = title
+            bold_rows[r] = True
+            r += 1
             # Datenzeilen
             for label, values in block:
-                self._model_res.appendRow(
-                    [QStandardItem(label)] + [QStandardItem(v) for v in values]
-                )
+                data[r, 0] = label
+                data[r, 1:1 + len(values)] = values
+                r += 1
             # Leerzeile zur optischen Trennung
-            self._model_res.appendRow([QStandardItem("")])
-
-        # Spaltenbreite
-        self.tableView_Ergebnis_Tabelle.resizeColumnsToContents()
+            data[r, 0] = ""
+            r += 1
 
-        # Diagramm + Tab-Umschaltung / Button-Enable unverändert
-        #self._plot_result_chart(res_all)
-        self.tabWidget.setCurrentWidget(self.tab_ergebnis)
-        self._btn_calc.setEnabled(True)
+        # ein Model-Reset; Spaltenbreiten regeln die Header-Modi
+        self._model_res.reset_with(data, bold_rows)
 
         # ----- 3) Reiter umschalten & Button frei geben -------------------
         self.tabWidget.setCurrentWidget(self.tab_ergebnis)
+        self._replot_if_visible()           # falls der Reiter schon aktiv war
         self._btn_calc.setEnabled(True)
 
+    def _replot_if_visible(self, *_) -> None:
+        """Zeichnet ein ausstehendes Diagramm, sobald der Ergebnis-Reiter
+        aktiv ist (auch per tabWidget.currentChanged)."""
+        if (self._chart_pending is None
+                or self.tabWidget.currentWidget() is not self.tab_ergebnis):
+            return
+        chart, self._chart_pending = self._chart_pending, None
+        self._plot_result_chart(chart)
+
     # ------------------------------------------------------------------
     # Fehler‑Callback  – wird vom CalcWorker ausgesendet
     # ------------------------------------------------------------------
@@ -1407,6 +1684,22 @@ class MainWindow(QtWidgets.QMainWindow):
     def _init_results_tab(self) -> None:
         """wird nur EINMAL beim Start aufgerufen."""
         self._models_ready = False  # noch keine Szenario-Spalten erzeugt
+        # Diagramm-Artists zum Wiederverwenden (siehe _plot_result_chart)
+        self._chart_key: tuple[int, ...] | None = None
+        self._chart_cursor = None
+        # Diagrammdaten (_prepare_chart_data) eines noch nicht gezeichneten Ergebnisses
+        self._chart_pending: dict | None = None
+        self.tabWidget.currentChanged.connect(self._replot_if_visible)
+
+        # „Bitte warten“-Dialog einmal anlegen, je Berechnung nur show()/hide()
+        self._wait_dialog = QProgressDialog("Berechnung läuft…", "", 0, 0, self)
+        self._wait_dialog.setWindowTitle("Bitte warten")
+        self._wait_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        self._wait_dialog.setCancelButton(None)
+        self._wait_dialog.reset()       # stoppt den Auto-Show-Timer des Dialogs
+
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
 
         # Matplotlib-Canvas aufbauen
         self._fig = Figure(figsize=(6, 3))
@@ -1446,7 +1739,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Ergebnis-Tabelle vorbereiten
         view = self.tableView_Ergebnis_Tabelle
-        self._model_res = QStandardItemModel(self)
+        self._model_res = ResultTableModel(self)
         view.setModel(self._model_res)
         hh = view.horizontalHeader()
         hh.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
@@ -1467,154 +1760,193 @@ class MainWindow(QtWidgets.QMainWindow):
             "ohne Speicher" if i == 0 else f"{i} Speicher"
             for i in range(n_scenarios)
         ]
-        self._model_res.setColumnCount(len(headers))
-        self._model_res.setHorizontalHeaderLabels(headers)
-
-        hh = self.tableView_Ergebnis_Tabelle.horizontalHeader()
-        # erst alles auf Stretch stellen …
-        hh.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-        # … dann Spalte 0 auf „nach Inhalt“
-        hh.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-
-    # ------------------------------------------------------------------
-    #  Tabellen füllen & Spaltenbreite anpassen
-    # ------------------------------------------------------------------
-    def _fill_table(
-            self,
-            view: QtWidgets.QTableView,
-            model: QStandardItemModel,
-            rows: list[tuple[str, list[str]]],
-    ) -> None:
-        """Schreibt *rows* in *model* und passt die Spalten im *view* an."""
-        model.setRowCount(0)
-        for name, values in rows:
-            model.appendRow([QStandardItem(name)] +
-                            [QStandardItem(v) for v in values])
-
-        view.resizeColumnsToContents()
-        view.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.ResizeToContents
-        )
+        view = self.tableView_Ergebnis_Tabelle
+        hh = view.horizontalHeader()
+        # Reset + Resize-Modi ohne Zwischen-Repaints; die Header-Signale
+        # bleiben an, sonst übernimmt der Header die neue Spaltenzahl nicht
+        view.setUpdatesEnabled(False)
+        try:
+            self._model_res.set_headers(headers)
+            # erst alles auf Stretch stellen …
+            hh.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+            # … dann Spalte 0 auf „nach Inhalt“
+            hh.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        finally:
+            view.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     #  Diagramm zeichnen – saubere Offsets & Legende
     # ------------------------------------------------------------------
-    def _plot_result_chart(self, res_all: dict[int, dict], *,
-                       disabled_months: list[int] | None = None) -> None:
-        self._fig.clear()
-        ax = self._fig.add_subplot(111)
+    def _prepare_chart_data(self, res_all: dict[int, dict]) -> dict:
+        """
+        Zieht in *einem* Durchlauf über die Szenarien alles, was Diagramm und
+        Speicheropt.-Label brauchen:
+        pv (12,), use/sur (n_scen, 12) und die abgeschalteten Monate des
+        ersten Speicher-Szenarios.
+        """
+        use, sur, disabled = [], [], []
+        for units in self._scenario_units:
+            dat = res_all[units]
+            s = "st" if units else "no_st"
+            use.append(_month_array(dat, f"mon_use_{s}"))
+            sur.append(_month_array(dat, f"mon_sur_{s}"))
+            if units and not disabled and dat.get("disabled_months"):
+                disabled = dat["disabled_months"]
+        return {
+            "pv":       _month_array(res_all[0], "mon_prod"),
+            "use":      np.stack(use),
+            "sur":      np.stack(sur),
+            "disabled": disabled,
+        }
 
-        months = range(1, 13)
+    def _plot_result_chart(self, chart: dict) -> None:
+        """Zeichnet die Monatsbalken aus `_prepare_chart_data`."""
+        months = np.arange(1, 13)
         n_scen = len(self._scenario_units)
+        pv, use_mat, sur_mat = chart["pv"], chart["use"], chart["sur"]
+        disabled_months = chart["disabled"]
+
+        # Gleiche Szenarien wie beim letzten Mal → vorhandene Balken nur
+        # in der Höhe anpassen statt Figure/Axes/Cursor neu aufzubauen
+        key = tuple(self._scenario_units)
+        if key == self._chart_key:
+            self._update_chart_bars(pv, use_mat, sur_mat, disabled_months)
+            return
 
-        # ---------------- Offsets & Balkenbreite ------------------------
-        #   Ziel: Jede Monats‑Gruppe passt sicher in ±0.45 Einheiten
+        if self._chart_cursor is not None:
+            self._chart_cursor.remove()
+        self._fig.clear()
+        ax = self._fig.add_subplot(111)
+
+        # ---------------- Offsets & Balkenbreite ------------------------
+        #   Ziel: Jede Monats‑Gruppe passt sicher in ±0.45 Einheiten
         #         (damit bleibt links/rechts Luft) – egal wie viele Szenarien.
         #
-        gap = 0.05                                # fester Daten‑Abstand ≈ 2 %
+        gap = 0.05                                # fester Daten‑Abstand ≈ 2 %
         max_span = 0.90                           # ges. Breite pro Monat
         bw = (max_span - len(self._scenario_units) * gap) / (len(self._scenario_units) + 1)
-        bw = max(0.08, min(0.22, bw))             # harte Grenzen 0.08 … 0.22
+        bw = max(0.08, min(0.22, bw))             # harte Grenzen 0.08 … 0.22
 
         span = len(self._scenario_units) * bw + (len(self._scenario_units)-1) * gap
         pv_off = -span / 2 - gap - bw             # PV‑Bar immer links außerhalb
 
-        def _off(idx: int) -> float:              # Offset je Szenario‑Index
-            return -span/2 + idx * (bw + gap)
-
+        offsets = -span / 2 + np.arange(n_scen) * (bw + gap)   # je Szenario‑Index
 
         colors = dict(PV="#F5BD60", use="#84A59E", sur="#C9C7D1")
 
-        disabled_months = disabled_months or []
-
         # ---------------- PV‑Balken (einmal) ---------------------------
-        ax.bar([m + pv_off for m in months], res_all[0]["mon_prod"],
+        pv_bars = ax.bar(months + pv_off, pv,
                width=bw, color=colors["PV"], edgecolor="#333",
                label="PV‑Erzeugung", zorder=3)
 
         # ---------------- Szenarien-Schleife ---------------------------
+        bar_pairs = []
         for idx, units in enumerate(self._scenario_units):
-            o = _off(idx)
-            dat = res_all[units]
-
-            # 1) Rohdaten ziehen (Series oder None)
-            if units:
-                ser_use = dat.get("mon_use_st")
-                ser_sur = dat.get("mon_sur_st")
-            else:
-                ser_use = dat.get("mon_use_no_st")
-                ser_sur = dat.get("mon_sur_no_st")
-
-            # 2) None-Fallback: bei None → Nullenliste
-            if ser_use is None:
-                mon_use = [0] * len(months)
-            else:
-                # pandas.Series → Python-Liste
-                mon_use = ser_use.tolist() if hasattr(ser_use, "tolist") else list(ser_use)
-
-            if ser_sur is None:
-                mon_sur = [0] * len(months)
-            else:
-                mon_sur = ser_sur.tolist() if hasattr(ser_sur, "tolist") else list(ser_sur)
+            x = months + offsets[idx]
 
-            # 3) Labels
+            # 1) Labels
             lbl_use = "Eigenverbrauch" + ("" if units == 0 else f" ({units} S)")
             lbl_sur = "Einspeisung"    + ("" if units == 0 else f" ({units} S)")
 
-            # 4) Balken zeichnen
-            bc_use = ax.bar([m + o for m in months],
-                            mon_use,
+            # 2) Balken zeichnen
+            bc_use = ax.bar(x,
+                            use_mat[idx],
                             width=bw,
                             color=colors["use"],
                             alpha=.9,
                             label=lbl_use)
-            bc_sur = ax.bar([m + o for m in months],
-                            mon_sur,
+            bc_sur = ax.bar(x,
+                            sur_mat[idx],
                             width=bw,
-                            bottom=mon_use,
+                            bottom=use_mat[idx],
                             color=colors["sur"],
                             alpha=.8,
                             label=lbl_sur)
+            bar_pairs.append((units, bc_use, bc_sur))
 
-            # 5) Rote Kontur für „abgeschaltete“ Monate
-            if units and disabled_months:
-                for patch, mon in zip(bc_use.patches, months):
-                    if mon in disabled_months:
-                        patch.set_edgecolor("red")
-                        patch.set_linewidth(1.4)
-                for patch, mon in zip(bc_sur.patches, months):
-                    if mon in disabled_months:
-                        patch.set_edgecolor("red")
-                        patch.set_linewidth(1.4)
+        # Ausgangs-Kontur merken, damit ein Update sie zurücksetzen kann
+        first = bar_pairs[0][1].patches[0]
+        self._bar_edge = (first.get_edgecolor(), first.get_linewidth())
+        self._mark_disabled_months(bar_pairs, disabled_months)
 
-        # ---------------- Achsen & Grid -------------------------------
+        # ---------------- Achsen & Grid -------------------------------
         ax.set_xticks(months, ["Jan","Feb","Mär","Apr","Mai","Jun",
                                "Jul","Aug","Sep","Okt","Nov","Dez"],
                       rotation=45)
-        # Y‑Achsen­label dichter an die Achse  → kleineres labelpad
+        # Y‑Achsen­label dichter an die Achse  → kleineres labelpad
         ax.set_ylabel("kWh", labelpad=4)
         ax.set_ylim(0, ax.get_ylim()[1]*1)
         ax.grid(axis="y", linestyle="--", alpha=.6)
 
         # ---------------- Mouse‑Over‑Tooltip --------------------------
+        # (mplcursors bindet die Artists fest beim Anlegen – neuer Cursor nur
+        # hier beim Neuaufbau, der Handler ist eine feste Methode)
+        import mplcursors
         cursor = mplcursors.cursor([c for c in ax.containers], hover=True)
-        @cursor.connect("add")
-        def _on_add(sel):
-            bar = sel.artist
-            val = bar.datavalues[sel.index]           # Wert aus dem Container holen
-            sel.annotation.set_text(f"{bar.get_label()}\n{val:.0f} kWh")    # Tooltip
-            sel.annotation.get_bbox_patch().set(fc="white", alpha=.9)       # Hintergrund
-            sel.annotation.arrow_patch.set_visible(False)                   # kein Pfeil
+        cursor.connect("add", self._on_chart_hover)
 
         # Rand­abstände manuell justieren: links enger, unten etwas Platz für xticks
-        self._fig.subplots_adjust(left=0.08,   # 8 %   statt ~12 %
+        self._fig.subplots_adjust(left=0.08,   # 8 %   statt ~12 %
                                 right=0.99,
                                 top=0.97,
                                 bottom=0.18) # falls xtick‑Labels zweizeilig
-        
-        self._fig.tight_layout()
+        # kein tight_layout(): würde die Ränder oben überschreiben und
+        # erzwingt je Aufruf einen Renderer-Durchlauf
         self._canvas.draw_idle()
+
+        self._chart_key = key
+        self._chart_ax = ax
+        self._chart_cursor = cursor
+        self._pv_bars = pv_bars
+        self._bar_pairs = bar_pairs
+
+    @staticmethod
+    def _on_chart_hover(sel) -> None:
+        """Tooltip eines Balkens (mplcursors-»add«-Handler)."""
+        bar = sel.artist
+        val = bar.datavalues[sel.index]           # Wert aus dem Container holen
+        sel.annotation.set_text(f"{bar.get_label()}\n{val:.0f} kWh")    # Tooltip
+        sel.annotation.get_bbox_patch().set(fc="white", alpha=.9)       # Hintergrund
+        sel.annotation.arrow_patch.set_visible(False)                   # kein Pfeil
+
+    def _update_chart_bars(self, pv: np.ndarray, use_mat: np.ndarray,
+                           sur_mat: np.ndarray, disabled_months: list[int]) -> None:
+        """Setzt neue Werte in die vorhandenen Balken (gleiche Szenarien)."""
+        # offene Tooltips zeigen sonst noch die alten Werte
+        for sel in self._chart_cursor.selections:
+            self._chart_cursor.remove_selection(sel)
+        for rect, h in zip(self._pv_bars.patches, pv):
+            rect.set_height(h)
+        self._pv_bars.datavalues = pv
+        for idx, (_, bc_use, bc_sur) in enumerate(self._bar_pairs):
+            use, sur = use_mat[idx], sur_mat[idx]
+            for rect_use, rect_sur, u, s in zip(bc_use.patches, bc_sur.patches, use, sur):
+                rect_use.set_height(u)
+                rect_sur.set_y(u)
+                rect_sur.set_height(s)
+            bc_use.datavalues = use                   # für den Tooltip
+            bc_sur.datavalues = sur
+        self._mark_disabled_months(self._bar_pairs, disabled_months)
+
+        ax = self._chart_ax
+        ax.relim()
+        ax.set_autoscaley_on(True)
+        ax.autoscale_view(scalex=False)
+        ax.set_ylim(0, ax.get_ylim()[1])
+        self._canvas.draw_idle()            # Ränder bleiben wie beim Aufbau
+
+    def _mark_disabled_months(self, bar_pairs, disabled_months: list[int]) -> None:
+        """Rote Kontur für „abgeschaltete“ Monate (nur Speicher-Szenarien)."""
+        edge, width = self._bar_edge
+        for units, bc_use, bc_sur in bar_pairs:
+            for bc in (bc_use, bc_sur):
+                for mon, patch in enumerate(bc.patches, start=1):
+                    if units and mon in disabled_months:
+                        patch.set_edgecolor("red")
+                        patch.set_linewidth(1.4)
+                    else:
+                        patch.set_edgecolor(edge)
+                        patch.set_linewidth(width)
         
     def _save_project(self) -> None:
         """Speichert das aktuelle Projekt an den bekannten Pfad oder fordert 'Speichern unter...' an."""
@@ -1633,11 +1965,12 @@ class MainWindow(QtWidgets.QMainWindow):
             self._save_project_to_file(fname)
 
     def _save_project_to_file(self, path: str) -> None:
-        """Schreibt die GUI-Parameter als JSON in die Datei."""
+        """Schreibt die GUI-Parameter als JSON in die Datei. Die Widgets
+        werden im GUI-Thread gelesen und serialisiert, nur das Schreiben
+        läuft im I/O-Pool."""
         settings = self._collect_settings()
-        data = asdict(settings)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        raw = _dump_project(asdict(settings))
+        self._start_project_io(Path(path).write_bytes, (raw,))
 
     def _open_project(self) -> None:
         """Öffnet einen bestehenden Projekt-File und lädt die Parameter."""
@@ -1646,17 +1979,26 @@ class MainWindow(QtWidgets.QMainWindow):
             "JSON-Dateien (*.json);;Alle Dateien (*)")
         if not fname:
             return
-        with open(fname, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # mppts als Dicts → in GeneratorConfig-Objekte umwandeln
-        if "mppts" in data:
-            data["mppts"] = [
-                GeneratorConfig(**mp) for mp in data["mppts"]
-            ]
-        # alle anderen Felder bleiben unverändert
-        settings = Settings(**data)
+        self._pending_project_path = fname
+        self._start_project_io(_read_project, (fname,),
+                               self._on_project_loaded)
+
+    def _on_project_loaded(self, settings: Settings) -> None:
         self._apply_settings(settings)
-        self._current_project_path = fname
+        self._current_project_path = self._pending_project_path
+
+    def _on_project_io_failed(self, msg: str) -> None:
+        QMessageBox.warning(self, "Projektdatei", msg)
+
+    def _start_project_io(self, fetch, args: tuple, on_done=None) -> None:
+        """Startet *fetch(*args)* im I/O-Pool; *on_done* muss eine
+        Methode von self sein, damit sie im GUI-Thread läuft."""
+        task = _BackgroundTask(fetch, *args)
+        if on_done is not None:
+            task.signals.finished.connect(on_done)
+        task.signals.failed.connect(self._on_project_io_failed)
+        self._io_task = task                # Signale am Leben halten
+        self._io_pool.start(task)
 
     def _apply_settings(self, settings: Settings) -> None:
         """Überträgt alle Felder aus `settings` zurück in die GUI."""
@@ -1705,41 +2047,38 @@ class MainWindow(QtWidgets.QMainWindow):
         self.radioButton_Profil_Rentner.setChecked(settings.profile == "retiree")
 
         # 7) Generator-Seiten neu aufbauen
-        #   zuerst vorhandene Seiten entfernen
-        for i in reversed(range(self.stackedWidget_Generator.count())):
-            page = self.stackedWidget_Generator.widget(i)
-            self.stackedWidget_Generator.removeWidget(page)
+        #   zuerst vorhandene Seiten in den Pool legen (umgekehrt, damit
+        #   _add_generator_page sie in der alten Reihenfolge wieder aufnimmt)
+        for page in reversed(self._generator_pages):
+            self._release_generator_page(page)
+        self._generator_pages.clear()
         self.listWidget_Generator.clear()
         #   dann anhand settings.mppts wieder hinzufügen
         for mppt in settings.mppts:
             self._add_generator_page()
-            page = self.stackedWidget_Generator.currentWidget()
-            page.findChild(QtWidgets.QSpinBox,   "spinBox_Modulanzahl_Generator_").setValue(mppt.n_modules)
-            page.findChild(QtWidgets.QComboBox,  "comboBox_Verschaltung_Generator_").setCurrentText(
-                "direkt" if mppt.connection == "direct" else "reihe"
-            )
-            page.findChild(QtWidgets.QSpinBox,   "spinBox_Leistung_Generator_").setValue(int(mppt.wp_module))
-            page.findChild(QtWidgets.QSpinBox,   "spinBox_Neigung_Generator_").setValue(int(mppt.tilt_deg))
-            page.findChild(QtWidgets.QSpinBox,   "spinBox_Azimut_Generator_").setValue(int(mppt.azimuth_deg))
-            page.findChild(QtWidgets.QComboBox,  "comboBox_MPPT_Input").setCurrentIndex(mppt.mppt_index - 1)
+            page = self._generator_pages[-1]
+            w = page._w
+            w.n_mod .setValue(mppt.n_modules)
+            w.conn  .setCurrentIndex(max(0, w.conn.findData(mppt.connection)))
+            w.wp_mod.setValue(int(mppt.wp_module))
+            w.tilt  .setValue(int(mppt.tilt_deg))
+            w.azm   .setValue(int(mppt.azimuth_deg))
+            w.mppt  .setCurrentIndex(mppt.mppt_index - 1)
             # 1) Schattierungsmodus (Radio-Buttons) setzen
-            rb_simple  = page.findChild(QtWidgets.QRadioButton, "radioButton_Shade_Simple")
-            rb_monthly = page.findChild(QtWidgets.QRadioButton, "radioButton_Shade_Monthly")
-            rb_simple .setChecked(mppt.shading_mode == "einfach")
-            rb_monthly.setChecked(mppt.shading_mode == "monatlich")
+            page.radioButton_Shade_Simple .setChecked(mppt.shading_mode == "einfach")
+            page.radioButton_Shade_Monthly.setChecked(mppt.shading_mode == "monatlich")
 
             # 2) Combo Level & Toggle aktivieren/deaktivieren
-            page.findChild(QtWidgets.QComboBox, "comboBox_Shade_Level")\
-                .setCurrentText(mppt.shading_simple_lvl)
+            w.shade_lvl.setCurrentText(mppt.shading_simple_lvl)
             # aktualisiert die Spinboxes entsprechend dem gewählten Modus
             self._toggle_shade_mode(page)
 
             # 3) Monatliche Werte befüllen
             for m, pct in mppt.shading_monthly_pct.items():
-                name = f"spinBox_Verschattung_{_month_abbr(m)}"
-                page.findChild(QtWidgets.QSpinBox, name).setValue(int(pct))
+                # Key aus JSON ist ein String, also in int konvertieren
+                w.shade[int(m) - 1].setValue(int(pct))
 
-            self._update_system_overview()
+        self._schedule_overview()
 
         # 8) Verluste
         # ─────────────────────────────────────────────────────────────
@@ -1747,24 +2086,13 @@ class MainWindow(QtWidgets.QMainWindow):
         raw_losses = settings.losses_pct or {}
 
         # 8a) Key-Normalisierung: alle unicode-Bindestriche → ASCII '-'
-        losses: dict[str, float] = {}
-        for k, v in raw_losses.items():
-            # k könnte z.B. "Modul-Mismatch" (\u2011) oder "Modul-Mismatch" sein
-            norm = k.replace("\u2011", "-").replace("\u2010", "-")
-            losses[norm] = v
-
-        # 8b) Jetzt die Widgets füllen – Labels benutzen ASCII-Bindestrich
-        for label, widget_name in (
-            ("Leitungsverluste",         "doubleSpinBox_Verluste_Leitungsverluste"),
-            ("Verschmutzung",            "doubleSpinBox_Verluste_Verschmutzung"),
-            ("Modul-Mismatch",           "doubleSpinBox_Verluste_Modul_Mismatch"),
-            ("LID",                      "doubleSpinBox_Verluste_LID"),
-            ("Nameplate-Toleranz",       "doubleSpinBox_Verluste_Nameplate_Toleranz"),
-            ("Alterung",                 "doubleSpinBox_Verluste_Alterung"),
-        ):
-            sb = self.findChild(QtWidgets.QDoubleSpinBox, widget_name)
+        #     (k könnte z.B. "Modul-Mismatch" (\u2011) oder "Modul-Mismatch" sein)
+        losses = {k.translate(_DASH_TRANS): v for k, v in raw_losses.items()}
+
+        # 8b) Jetzt die (in __init__ gemerkten) Widgets füllen – Label ebenso normieren
+        for label, sb in self._loss_widgets:
             # sichere Lookup-Reihenfolge: normiertes Label, ansonsten 0.0
-            val = losses.get(label, 0.0)
+            val = losses.get(label.translate(_DASH_TRANS), 0.0)
             sb.setValue(val)
 
         # 9) Kosten
@@ -1781,7 +2109,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _toggle_debug_window(self, checked: bool) -> None:
         """Slot für checkBox_debug_window: Debug-Fenster zeigen/verstecken."""
+        calc_logger = logging.getLogger("logic.calculation")
         if checked:
             self._debug_window.show()
+            calc_logger.addHandler(self._qt_handler)
+            self._qt_handler.timer.start()
         else:
+            calc_logger.removeHandler(self._qt_handler)
+            self._qt_handler.timer.stop()
+            self._qt_handler.flush_pending()
             self._debug_window.hide()
\ No newline at end of file
@@ -12,7 +12,7 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
-        MainWindow.resize(1221, 739)
+        MainWindow.resize(1230, 739)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -1920,7 +1920,7 @@ class Ui_MainWindow(object):
         self.verticalLayout_4.addLayout(self.verticalLayout)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
-        self.menubar.setGeometry(QtCore.QRect(0, 0, 1221, 23))
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1230, 23))
         font = QtGui.QFont()
         font.setPointSize(10)
         font.setBold(False)
@@ -2000,7 +2000,7 @@ class Ui_MainWindow(object):
         self.label_Verluste_Verschmutzung.setBuddy(self.doubleSpinBox_Verluste_Verschmutzung)
 
         self.retranslateUi(MainWindow)
-        self.tabWidget.setCurrentIndex(0)
+        self.tabWidget.setCurrentIndex(1)
         self.stackedWidget_Generator.setCurrentIndex(0)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
         MainWindow.setTabOrder(self.doubleSpinBox_Standort_Breitengrad, self.doubleSpinBox_Standort_Laengengrad)
@@ -2131,27 +2131,27 @@ class Ui_MainWindow(object):
         self.label.setText(_translate("MainWindow", "Verluste"))
         self.label_19.setText(_translate("MainWindow", "Stringkonfiguration"))
         self.label_StringConfig_MPPT_Inputs.setText(_translate("MainWindow", "MPPT Eingänge:"))
-        self.label_StringConfig_MPPT_Inputs_Text.setText(_translate("MainWindow", "---"))
+        self.label_StringConfig_MPPT_Inputs_Text.setText(_translate("MainWindow", "—"))
         self.label_StringConfig_Modulanzahl.setText(_translate("MainWindow", "Modulanzahl:"))
-        self.label_StringConfig_Modulanzahl_Text.setText(_translate("MainWindow", "---"))
+        self.label_StringConfig_Modulanzahl_Text.setText(_translate("MainWindow", "—"))
         self.label_StringConfig_ModulleistungGes.setText(_translate("MainWindow", "PV-Generatorenleistung:"))
-        self.label_StringConfig_ModulleistungGes_Text.setText(_translate("MainWindow", "---"))
-        self.label_StringConfig_MPPTConfig_Text.setText(_translate("MainWindow", "---"))
+        self.label_StringConfig_ModulleistungGes_Text.setText(_translate("MainWindow", "—"))
+        self.label_StringConfig_MPPTConfig_Text.setText(_translate("MainWindow", "—"))
         self.pushButton_back_to_Tab_Ort.setText(_translate("MainWindow", "Zurück"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_anlage), _translate("MainWindow", "Anlage"))
         self.label_16.setText(_translate("MainWindow", "Übersicht"))
         self.label_Ergebnis_Hersteller.setText(_translate("MainWindow", "Hersteller:"))
-        self.label_Ergebnis_Hersteller_Text.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_Hersteller_Text.setText(_translate("MainWindow", "—"))
         self.label_Ergebnis_System.setText(_translate("MainWindow", "System:"))
-        self.label_Ergebnis_System_Text.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_System_Text.setText(_translate("MainWindow", "—"))
         self.label_Ergebnis_Inverter.setText(_translate("MainWindow", "Wechselrichter:"))
-        self.label_Ergebnis_Inverter_Text.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_Inverter_Text.setText(_translate("MainWindow", "—"))
         self.label_Ergebnis_PV_GeneratorWp.setText(_translate("MainWindow", "PV-Gneratorleistung:"))
-        self.label_Ergebnis_PV_GeneratorWp_Text.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_PV_GeneratorWp_Text.setText(_translate("MainWindow", "—"))
         self.label_Ergebnis_Speichertyp.setText(_translate("MainWindow", "Speichertyp:"))
-        self.label_Ergebnis_Speichertyp_Text.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_Speichertyp_Text.setText(_translate("MainWindow", "—"))
         self.label_17.setText(_translate("MainWindow", "Speicherabschaltung:"))
-        self.label_Ergebnis_Speicheropt.setText(_translate("MainWindow", "---"))
+        self.label_Ergebnis_Speicheropt.setText(_translate("MainWindow", "—"))
         self.label_18.setText(_translate("MainWindow", "Legende"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_ergebnis), _translate("MainWindow", "Ergebnis"))
         self.menuMen.setTitle(_translate("MainWindow", "Menü"))
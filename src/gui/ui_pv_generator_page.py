@@ -0,0 +1,630 @@
+# Form implementation generated from reading ui file 'src/ui/pv_generator_page.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(531, 404)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(Form)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.line_6 = QtWidgets.QFrame(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.line_6.sizePolicy().hasHeightForWidth())
+        self.line_6.setSizePolicy(sizePolicy)
+        self.line_6.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_6.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_6.setObjectName("line_6")
+        self.gridLayout.addWidget(self.line_6, 1, 0, 1, 1)
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.frame_azimut = AzimuthWidget(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame_azimut.sizePolicy().hasHeightForWidth())
+        self.frame_azimut.setSizePolicy(sizePolicy)
+        self.frame_azimut.setMinimumSize(QtCore.QSize(150, 150))
+        self.frame_azimut.setMaximumSize(QtCore.QSize(150, 150))
+        self.frame_azimut.setSizeIncrement(QtCore.QSize(0, 0))
+        self.frame_azimut.setBaseSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setStrikeOut(False)
+        self.frame_azimut.setFont(font)
+        self.frame_azimut.setAutoFillBackground(True)
+        self.frame_azimut.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.frame_azimut.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.frame_azimut.setMidLineWidth(1)
+        self.frame_azimut.setObjectName("frame_azimut")
+        self.verticalLayout_4.addWidget(self.frame_azimut)
+        self.label = QtWidgets.QLabel(parent=Form)
+        self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.label.setObjectName("label")
+        self.verticalLayout_4.addWidget(self.label)
+        self.gridLayout.addLayout(self.verticalLayout_4, 0, 4, 1, 1)
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.frame_neigung = TiltWidget(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame_neigung.sizePolicy().hasHeightForWidth())
+        self.frame_neigung.setSizePolicy(sizePolicy)
+        self.frame_neigung.setMinimumSize(QtCore.QSize(150, 150))
+        self.frame_neigung.setMaximumSize(QtCore.QSize(150, 150))
+        self.frame_neigung.setSizeIncrement(QtCore.QSize(0, 0))
+        self.frame_neigung.setBaseSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setStrikeOut(False)
+        self.frame_neigung.setFont(font)
+        self.frame_neigung.setAutoFillBackground(True)
+        self.frame_neigung.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.frame_neigung.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.frame_neigung.setMidLineWidth(1)
+        self.frame_neigung.setObjectName("frame_neigung")
+        self.verticalLayout_5.addWidget(self.frame_neigung)
+        self.label_2 = QtWidgets.QLabel(parent=Form)
+        self.label_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_5.addWidget(self.label_2)
+        self.gridLayout.addLayout(self.verticalLayout_5, 0, 6, 1, 1)
+        self.horizontalLayout_PV_Generator_MPPT_Settings = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_PV_Generator_MPPT_Settings.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetDefaultConstraint)
+        self.horizontalLayout_PV_Generator_MPPT_Settings.setSpacing(0)
+        self.horizontalLayout_PV_Generator_MPPT_Settings.setObjectName("horizontalLayout_PV_Generator_MPPT_Settings")
+        self.gridLayout.addLayout(self.horizontalLayout_PV_Generator_MPPT_Settings, 0, 0, 1, 1)
+        self.formLayout_PV_Generator_Settings = QtWidgets.QFormLayout()
+        self.formLayout_PV_Generator_Settings.setObjectName("formLayout_PV_Generator_Settings")
+        self.label_MPPT_Eingang_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_MPPT_Eingang_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_MPPT_Eingang_Generator_.setSizePolicy(sizePolicy)
+        self.label_MPPT_Eingang_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_MPPT_Eingang_Generator_.setObjectName("label_MPPT_Eingang_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_MPPT_Eingang_Generator_)
+        self.comboBox_MPPT_Input = QtWidgets.QComboBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBox_MPPT_Input.sizePolicy().hasHeightForWidth())
+        self.comboBox_MPPT_Input.setSizePolicy(sizePolicy)
+        self.comboBox_MPPT_Input.setMinimumSize(QtCore.QSize(0, 22))
+        self.comboBox_MPPT_Input.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.comboBox_MPPT_Input.setDuplicatesEnabled(False)
+        self.comboBox_MPPT_Input.setFrame(True)
+        self.comboBox_MPPT_Input.setObjectName("comboBox_MPPT_Input")
+        self.formLayout_PV_Generator_Settings.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboBox_MPPT_Input)
+        self.label_Modulanzahl_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Modulanzahl_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_Modulanzahl_Generator_.setSizePolicy(sizePolicy)
+        self.label_Modulanzahl_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Modulanzahl_Generator_.setObjectName("label_Modulanzahl_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Modulanzahl_Generator_)
+        self.spinBox_Modulanzahl_Generator_ = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Modulanzahl_Generator_.sizePolicy().hasHeightForWidth())
+        self.spinBox_Modulanzahl_Generator_.setSizePolicy(sizePolicy)
+        self.spinBox_Modulanzahl_Generator_.setMinimumSize(QtCore.QSize(0, 22))
+        self.spinBox_Modulanzahl_Generator_.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.spinBox_Modulanzahl_Generator_.setMaximum(100)
+        self.spinBox_Modulanzahl_Generator_.setProperty("value", 1)
+        self.spinBox_Modulanzahl_Generator_.setObjectName("spinBox_Modulanzahl_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinBox_Modulanzahl_Generator_)
+        self.label_Verschaltung_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschaltung_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_Verschaltung_Generator_.setSizePolicy(sizePolicy)
+        self.label_Verschaltung_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Verschaltung_Generator_.setObjectName("label_Verschaltung_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Verschaltung_Generator_)
+        self.comboBox_Verschaltung_Generator_ = QtWidgets.QComboBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBox_Verschaltung_Generator_.sizePolicy().hasHeightForWidth())
+        self.comboBox_Verschaltung_Generator_.setSizePolicy(sizePolicy)
+        self.comboBox_Verschaltung_Generator_.setMinimumSize(QtCore.QSize(0, 22))
+        self.comboBox_Verschaltung_Generator_.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.comboBox_Verschaltung_Generator_.setObjectName("comboBox_Verschaltung_Generator_")
+        self.comboBox_Verschaltung_Generator_.addItem("")
+        self.comboBox_Verschaltung_Generator_.addItem("")
+        self.formLayout_PV_Generator_Settings.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboBox_Verschaltung_Generator_)
+        self.label_Leistung_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Leistung_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_Leistung_Generator_.setSizePolicy(sizePolicy)
+        self.label_Leistung_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Leistung_Generator_.setObjectName("label_Leistung_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(4, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Leistung_Generator_)
+        self.spinBox_Leistung_Generator_ = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Leistung_Generator_.sizePolicy().hasHeightForWidth())
+        self.spinBox_Leistung_Generator_.setSizePolicy(sizePolicy)
+        self.spinBox_Leistung_Generator_.setMinimumSize(QtCore.QSize(0, 22))
+        self.spinBox_Leistung_Generator_.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.spinBox_Leistung_Generator_.setMaximum(10000)
+        self.spinBox_Leistung_Generator_.setProperty("value", 430)
+        self.spinBox_Leistung_Generator_.setObjectName("spinBox_Leistung_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinBox_Leistung_Generator_)
+        self.label_Neigung_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Neigung_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_Neigung_Generator_.setSizePolicy(sizePolicy)
+        self.label_Neigung_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Neigung_Generator_.setObjectName("label_Neigung_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(5, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Neigung_Generator_)
+        self.spinBox_Neigung_Generator_ = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Neigung_Generator_.sizePolicy().hasHeightForWidth())
+        self.spinBox_Neigung_Generator_.setSizePolicy(sizePolicy)
+        self.spinBox_Neigung_Generator_.setMinimumSize(QtCore.QSize(0, 22))
+        self.spinBox_Neigung_Generator_.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.spinBox_Neigung_Generator_.setMaximum(90)
+        self.spinBox_Neigung_Generator_.setProperty("value", 70)
+        self.spinBox_Neigung_Generator_.setObjectName("spinBox_Neigung_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(5, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinBox_Neigung_Generator_)
+        self.label_Azimut_Generator_ = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Azimut_Generator_.sizePolicy().hasHeightForWidth())
+        self.label_Azimut_Generator_.setSizePolicy(sizePolicy)
+        self.label_Azimut_Generator_.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Azimut_Generator_.setObjectName("label_Azimut_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(6, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Azimut_Generator_)
+        self.spinBox_Azimut_Generator_ = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Azimut_Generator_.sizePolicy().hasHeightForWidth())
+        self.spinBox_Azimut_Generator_.setSizePolicy(sizePolicy)
+        self.spinBox_Azimut_Generator_.setMinimumSize(QtCore.QSize(0, 22))
+        self.spinBox_Azimut_Generator_.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.spinBox_Azimut_Generator_.setMinimum(0)
+        self.spinBox_Azimut_Generator_.setMaximum(359)
+        self.spinBox_Azimut_Generator_.setProperty("value", 270)
+        self.spinBox_Azimut_Generator_.setObjectName("spinBox_Azimut_Generator_")
+        self.formLayout_PV_Generator_Settings.setWidget(6, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinBox_Azimut_Generator_)
+        self.gridLayout.addLayout(self.formLayout_PV_Generator_Settings, 0, 2, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem, 0, 7, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem1, 0, 3, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem2, 0, 5, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout.addItem(spacerItem3)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+        self.line = QtWidgets.QFrame(parent=Form)
+        self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_2.addWidget(self.line)
+        self.formLayout_PV_Generator_Verschattungsmodell = QtWidgets.QFormLayout()
+        self.formLayout_PV_Generator_Verschattungsmodell.setObjectName("formLayout_PV_Generator_Verschattungsmodell")
+        self.label_Vertschattungsmodell = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Vertschattungsmodell.sizePolicy().hasHeightForWidth())
+        self.label_Vertschattungsmodell.setSizePolicy(sizePolicy)
+        self.label_Vertschattungsmodell.setMinimumSize(QtCore.QSize(80, 22))
+        self.label_Vertschattungsmodell.setObjectName("label_Vertschattungsmodell")
+        self.formLayout_PV_Generator_Verschattungsmodell.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.label_Vertschattungsmodell)
+        self.radioButton_Shade_Simple = QtWidgets.QRadioButton(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.radioButton_Shade_Simple.sizePolicy().hasHeightForWidth())
+        self.radioButton_Shade_Simple.setSizePolicy(sizePolicy)
+        self.radioButton_Shade_Simple.setMinimumSize(QtCore.QSize(80, 22))
+        self.radioButton_Shade_Simple.setChecked(True)
+        self.radioButton_Shade_Simple.setObjectName("radioButton_Shade_Simple")
+        self.formLayout_PV_Generator_Verschattungsmodell.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.radioButton_Shade_Simple)
+        self.comboBox_Shade_Level = QtWidgets.QComboBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBox_Shade_Level.sizePolicy().hasHeightForWidth())
+        self.comboBox_Shade_Level.setSizePolicy(sizePolicy)
+        self.comboBox_Shade_Level.setMinimumSize(QtCore.QSize(0, 22))
+        self.comboBox_Shade_Level.setMaximumSize(QtCore.QSize(300, 16777215))
+        self.comboBox_Shade_Level.setObjectName("comboBox_Shade_Level")
+        self.formLayout_PV_Generator_Verschattungsmodell.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboBox_Shade_Level)
+        self.radioButton_Shade_Monthly = QtWidgets.QRadioButton(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.radioButton_Shade_Monthly.sizePolicy().hasHeightForWidth())
+        self.radioButton_Shade_Monthly.setSizePolicy(sizePolicy)
+        self.radioButton_Shade_Monthly.setMinimumSize(QtCore.QSize(80, 22))
+        self.radioButton_Shade_Monthly.setObjectName("radioButton_Shade_Monthly")
+        self.formLayout_PV_Generator_Verschattungsmodell.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.radioButton_Shade_Monthly)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.formLayout_PV_Generator_Verschattungsmodell.setItem(3, QtWidgets.QFormLayout.ItemRole.LabelRole, spacerItem4)
+        self.verticalLayout_2.addLayout(self.formLayout_PV_Generator_Verschattungsmodell)
+        self.gridLayout_PV_Generator_Verschattung = QtWidgets.QGridLayout()
+        self.gridLayout_PV_Generator_Verschattung.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetDefaultConstraint)
+        self.gridLayout_PV_Generator_Verschattung.setContentsMargins(4, 4, 4, 4)
+        self.gridLayout_PV_Generator_Verschattung.setSpacing(6)
+        self.gridLayout_PV_Generator_Verschattung.setObjectName("gridLayout_PV_Generator_Verschattung")
+        self.label_Verschattung_Feb = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Feb.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Feb.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Feb.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Feb.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Feb.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Feb.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Feb.setWordWrap(False)
+        self.label_Verschattung_Feb.setObjectName("label_Verschattung_Feb")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Feb, 0, 3, 1, 1)
+        self.label_Verschattung_Jan = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Jan.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Jan.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Jan.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Jan.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Jan.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Jan.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Jan.setWordWrap(False)
+        self.label_Verschattung_Jan.setObjectName("label_Verschattung_Jan")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Jan, 0, 0, 1, 1)
+        self.spinBox_Verschattung_Jan = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Jan.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Jan.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Jan.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Jan.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Jan.setMaximum(100)
+        self.spinBox_Verschattung_Jan.setObjectName("spinBox_Verschattung_Jan")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Jan, 0, 1, 1, 1)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_PV_Generator_Verschattung.addItem(spacerItem5, 4, 3, 1, 1)
+        self.spinBox_Verschattung_Feb = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Feb.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Feb.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Feb.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Feb.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Feb.setMaximum(100)
+        self.spinBox_Verschattung_Feb.setObjectName("spinBox_Verschattung_Feb")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Feb, 0, 4, 1, 1)
+        spacerItem6 = QtWidgets.QSpacerItem(50, 0, QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_PV_Generator_Verschattung.addItem(spacerItem6, 0, 5, 1, 1)
+        spacerItem7 = QtWidgets.QSpacerItem(50, 0, QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_PV_Generator_Verschattung.addItem(spacerItem7, 0, 2, 1, 1)
+        self.spinBox_Verschattung_Mar = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Mar.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Mar.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Mar.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Mar.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Mar.setMaximum(100)
+        self.spinBox_Verschattung_Mar.setObjectName("spinBox_Verschattung_Mar")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Mar, 0, 7, 1, 1)
+        self.label_Verschattung_Mar = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Mar.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Mar.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Mar.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Mar.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Mar.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Mar.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Mar.setWordWrap(False)
+        self.label_Verschattung_Mar.setObjectName("label_Verschattung_Mar")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Mar, 0, 6, 1, 1)
+        self.spinBox_Verschattung_Jun = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Jun.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Jun.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Jun.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Jun.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Jun.setMaximum(100)
+        self.spinBox_Verschattung_Jun.setObjectName("spinBox_Verschattung_Jun")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Jun, 1, 4, 1, 1)
+        self.spinBox_Verschattung_May = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_May.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_May.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_May.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_May.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_May.setMaximum(100)
+        self.spinBox_Verschattung_May.setObjectName("spinBox_Verschattung_May")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_May, 1, 1, 1, 1)
+        self.spinBox_Verschattung_Jul = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Jul.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Jul.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Jul.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Jul.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Jul.setMaximum(100)
+        self.spinBox_Verschattung_Jul.setObjectName("spinBox_Verschattung_Jul")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Jul, 1, 7, 1, 1)
+        self.label_Verschattung_Nov = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Nov.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Nov.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Nov.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Nov.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Nov.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Nov.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Nov.setWordWrap(False)
+        self.label_Verschattung_Nov.setObjectName("label_Verschattung_Nov")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Nov, 2, 6, 1, 1)
+        self.label_Verschattung_May = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_May.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_May.setSizePolicy(sizePolicy)
+        self.label_Verschattung_May.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_May.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_May.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_May.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_May.setWordWrap(False)
+        self.label_Verschattung_May.setObjectName("label_Verschattung_May")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_May, 1, 0, 1, 1)
+        self.label_Verschattung_Apr = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Apr.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Apr.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Apr.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Apr.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Apr.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Apr.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Apr.setWordWrap(False)
+        self.label_Verschattung_Apr.setObjectName("label_Verschattung_Apr")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Apr, 0, 9, 1, 1)
+        self.spinBox_Verschattung_Oct = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Oct.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Oct.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Oct.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Oct.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Oct.setMaximum(100)
+        self.spinBox_Verschattung_Oct.setObjectName("spinBox_Verschattung_Oct")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Oct, 2, 4, 1, 1)
+        self.label_Verschattung_Aug = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Aug.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Aug.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Aug.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Aug.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Aug.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Aug.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Aug.setWordWrap(False)
+        self.label_Verschattung_Aug.setObjectName("label_Verschattung_Aug")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Aug, 1, 9, 1, 1)
+        self.spinBox_Verschattung_Apr = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Apr.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Apr.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Apr.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Apr.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Apr.setMaximum(100)
+        self.spinBox_Verschattung_Apr.setObjectName("spinBox_Verschattung_Apr")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Apr, 0, 10, 1, 1)
+        self.spinBox_Verschattung_Sep = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Sep.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Sep.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Sep.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Sep.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Sep.setMaximum(100)
+        self.spinBox_Verschattung_Sep.setObjectName("spinBox_Verschattung_Sep")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Sep, 2, 1, 1, 1)
+        self.label_Verschattung_Oct = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Oct.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Oct.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Oct.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Oct.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Oct.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Oct.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Oct.setWordWrap(False)
+        self.label_Verschattung_Oct.setObjectName("label_Verschattung_Oct")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Oct, 2, 3, 1, 1)
+        spacerItem8 = QtWidgets.QSpacerItem(50, 0, QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_PV_Generator_Verschattung.addItem(spacerItem8, 0, 8, 1, 1)
+        self.label_Verschattung_Sep = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Sep.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Sep.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Sep.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Sep.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Sep.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Sep.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Sep.setWordWrap(False)
+        self.label_Verschattung_Sep.setObjectName("label_Verschattung_Sep")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Sep, 2, 0, 1, 1)
+        self.label_Verschattung_Jul = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Jul.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Jul.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Jul.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Jul.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Jul.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Jul.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Jul.setWordWrap(False)
+        self.label_Verschattung_Jul.setObjectName("label_Verschattung_Jul")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Jul, 1, 6, 1, 1)
+        self.spinBox_Verschattung_Aug = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Aug.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Aug.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Aug.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Aug.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Aug.setMaximum(100)
+        self.spinBox_Verschattung_Aug.setObjectName("spinBox_Verschattung_Aug")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Aug, 1, 10, 1, 1)
+        self.label_Verschattung_Jun = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Jun.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Jun.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Jun.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Jun.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Jun.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Jun.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Jun.setWordWrap(False)
+        self.label_Verschattung_Jun.setObjectName("label_Verschattung_Jun")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Jun, 1, 3, 1, 1)
+        self.label_Verschattung_Dec = QtWidgets.QLabel(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_Verschattung_Dec.sizePolicy().hasHeightForWidth())
+        self.label_Verschattung_Dec.setSizePolicy(sizePolicy)
+        self.label_Verschattung_Dec.setMinimumSize(QtCore.QSize(50, 22))
+        self.label_Verschattung_Dec.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.label_Verschattung_Dec.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.label_Verschattung_Dec.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.label_Verschattung_Dec.setWordWrap(False)
+        self.label_Verschattung_Dec.setObjectName("label_Verschattung_Dec")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.label_Verschattung_Dec, 2, 9, 1, 1)
+        self.spinBox_Verschattung_Nov = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Nov.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Nov.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Nov.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Nov.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Nov.setMaximum(100)
+        self.spinBox_Verschattung_Nov.setObjectName("spinBox_Verschattung_Nov")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Nov, 2, 7, 1, 1)
+        self.spinBox_Verschattung_Dec = QtWidgets.QSpinBox(parent=Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spinBox_Verschattung_Dec.sizePolicy().hasHeightForWidth())
+        self.spinBox_Verschattung_Dec.setSizePolicy(sizePolicy)
+        self.spinBox_Verschattung_Dec.setMinimumSize(QtCore.QSize(50, 22))
+        self.spinBox_Verschattung_Dec.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.spinBox_Verschattung_Dec.setMaximum(100)
+        self.spinBox_Verschattung_Dec.setObjectName("spinBox_Verschattung_Dec")
+        self.gridLayout_PV_Generator_Verschattung.addWidget(self.spinBox_Verschattung_Dec, 2, 10, 1, 1)
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout_PV_Generator_Verschattung.addItem(spacerItem9, 0, 11, 1, 1)
+        self.verticalLayout_2.addLayout(self.gridLayout_PV_Generator_Verschattung)
+        self.label_MPPT_Eingang_Generator_.setBuddy(self.comboBox_MPPT_Input)
+        self.label_Modulanzahl_Generator_.setBuddy(self.spinBox_Modulanzahl_Generator_)
+        self.label_Verschaltung_Generator_.setBuddy(self.comboBox_Verschaltung_Generator_)
+        self.label_Leistung_Generator_.setBuddy(self.spinBox_Leistung_Generator_)
+        self.label_Neigung_Generator_.setBuddy(self.spinBox_Neigung_Generator_)
+        self.label_Azimut_Generator_.setBuddy(self.spinBox_Azimut_Generator_)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.label.setText(_translate("Form", "Neigung"))
+        self.label_2.setText(_translate("Form", "Azimut"))
+        self.label_MPPT_Eingang_Generator_.setText(_translate("Form", "MPPT Eingang"))
+        self.comboBox_MPPT_Input.setToolTip(_translate("Form", "Auswahl MPPT-Eingang"))
+        self.label_Modulanzahl_Generator_.setText(_translate("Form", "Modulanzahl (#)"))
+        self.spinBox_Modulanzahl_Generator_.setToolTip(_translate("Form", "Anzahl PV-Module am MPPT-Eingang"))
+        self.label_Verschaltung_Generator_.setText(_translate("Form", "Verschaltung"))
+        self.comboBox_Verschaltung_Generator_.setToolTip(_translate("Form", "Verschaltungsart wählen (Direkt, Parallel)"))
+        self.comboBox_Verschaltung_Generator_.setItemText(0, _translate("Form", "Direkt"))
+        self.comboBox_Verschaltung_Generator_.setItemText(1, _translate("Form", "Reihe"))
+        self.label_Leistung_Generator_.setText(_translate("Form", "Leistung (Wp)"))
+        self.spinBox_Leistung_Generator_.setToolTip(_translate("Form", "Nennleistung pro Modul in Watt-Peak (Wp)"))
+        self.label_Neigung_Generator_.setText(_translate("Form", "Neigung (°)"))
+        self.spinBox_Neigung_Generator_.setToolTip(_translate("Form", "Modulneigung (°)\n"
+"0° = Waagerecht\n"
+"90° = Senkrecht"))
+        self.label_Azimut_Generator_.setText(_translate("Form", "Azimut (°)"))
+        self.spinBox_Azimut_Generator_.setToolTip(_translate("Form", "<html><head/><body><p>Modulausrichtung in Grad</p><p>0° = Nord<br/>90° = Ost<br/>180° =Süd<br/>270° = West</p></body></html>"))
+        self.label_Vertschattungsmodell.setText(_translate("Form", "Verschattungsmodell"))
+        self.radioButton_Shade_Simple.setToolTip(_translate("Form", "Einfache Verschattung (keine, leicht, mittel oder stark)"))
+        self.radioButton_Shade_Simple.setText(_translate("Form", "Einfach"))
+        self.comboBox_Shade_Level.setToolTip(_translate("Form", "<html><head/><body><p>Einfache Verschattung (keine, leicht, mittel oder stark)</p></body></html>"))
+        self.radioButton_Shade_Monthly.setToolTip(_translate("Form", "Monatliches Verschattungsprofil in % (0 % = keine Abschattung, 100 % = nur diffuses Licht)"))
+        self.radioButton_Shade_Monthly.setText(_translate("Form", "Monatlich"))
+        self.label_Verschattung_Feb.setText(_translate("Form", "Feb (%)"))
+        self.label_Verschattung_Jan.setText(_translate("Form", "Jan (%)"))
+        self.label_Verschattung_Mar.setText(_translate("Form", "Mar (%)"))
+        self.label_Verschattung_Nov.setText(_translate("Form", "Nov (%)"))
+        self.label_Verschattung_May.setText(_translate("Form", "May (%)"))
+        self.label_Verschattung_Apr.setText(_translate("Form", "Apr (%)"))
+        self.label_Verschattung_Aug.setText(_translate("Form", "Aug (%)"))
+        self.label_Verschattung_Oct.setText(_translate("Form", "Oct (%)"))
+        self.label_Verschattung_Sep.setText(_translate("Form", "Sep (%)"))
+        self.label_Verschattung_Jul.setText(_translate("Form", "Jul (%)"))
+        self.label_Verschattung_Jun.setText(_translate("Form", "Jun (%)"))
+        self.label_Verschattung_Dec.setText(_translate("Form", "Dec (%)"))
+from gui.widgets import AzimuthWidget, TiltWidget
@@ -10,95 +10,248 @@ CLR_ARROW  = QtGui.QColor("#FF8F00")   # Amber 800
 CLR_SCALE  = QtGui.QColor("#424242")   # Dunkelgrau für Skala
 CLR_SUN    = QtGui.QColor("#FFC107")   # Sonnengelb
 
+# Stifte/Pinsel einmal anlegen statt je paintEvent
+_NO_PEN        = QtCore.Qt.PenStyle.NoPen
+_NO_BRUSH      = QtCore.Qt.BrushStyle.NoBrush
+_PEN_SUN_RAYS  = QtGui.QPen(CLR_SUN, 2)
+_PEN_WALL      = QtGui.QPen(CLR_WALL, 12, QtCore.Qt.PenStyle.SolidLine,
+                            QtCore.Qt.PenCapStyle.SquareCap)
+_PEN_SCALE     = QtGui.QPen(CLR_SCALE, 1.5)
+_PEN_CIRCLE    = QtGui.QPen(CLR_WALL, 2)
+_PEN_ARROW     = QtGui.QPen(CLR_ARROW, 2)
+_BR_SUN        = QtGui.QBrush(CLR_SUN)
+_BR_MODULE     = QtGui.QBrush(CLR_MODULE)
+_BR_ARROW      = QtGui.QBrush(CLR_ARROW)
+
+# Die festen Zeichnungen (Sonnenstrahlen, Winkelskala) nutzen nur Vielfache
+# von 45° – (cos, sin) dafür einmal beim Import
+_DEG_COS_SIN = {a: (math.cos(math.radians(a)), math.sin(math.radians(a)))
+                for a in range(0, 360, 45)}
+
+# Sonne oben links (Mittelpunkt, Radius) und ihre 8 Strahlen
+SUN_CENTER = QtCore.QPointF(16, 16)
+SUN_R      = 8
+_SUN_RAYS = [
+    QtCore.QLineF(
+        SUN_CENTER.x() + SUN_R * 0.9 * c,
+        SUN_CENTER.y() + SUN_R * 0.9 * s,
+        SUN_CENTER.x() + (SUN_R + 5) * c,
+        SUN_CENTER.y() + (SUN_R + 5) * s,
+    )
+    for c, s in _DEG_COS_SIN.values()
+]
+
+# Winkelskala der Neigungs-Ansicht: (Text, (cos, sin) der Drehung um -Grad)
+_SCALE_TICKS = tuple((label, _DEG_COS_SIN[-deg % 360])
+                     for deg, label in ((0, "0°"), (45, "45°"), (90, "90°")))
+
+# Himmelsrichtungen der Azimut-Ansicht: (Text, Richtung x, Richtung y)
+_COMPASS_LABELS = (("N", 0, -1), ("E", 1, 0), ("S", 0, 1), ("W", -1, 0))
+
+
+def _label_font(base: QtGui.QFont) -> tuple[QtGui.QFont, QtGui.QFontMetricsF]:
+    """Beschriftungs-Font (8 pt, fett) auf Basis des Widget-Fonts samt
+    Metriken – die Widgets merken sich das Paar bis zur nächsten FontChange."""
+    font = QtGui.QFont(base)
+    font.setPointSize(8)
+    font.setWeight(QtGui.QFont.Weight.Bold)
+    return font, QtGui.QFontMetricsF(font)
+
+
+def _rounded_path(rect: QtCore.QRectF) -> QtGui.QPainterPath:
+    """Modul-Umriss (Radius 2 px) als wiederverwendbarer Pfad."""
+    path = QtGui.QPainterPath()
+    path.addRoundedRect(rect, 2, 2)
+    return path
+
+
+def _cos_sin(deg: float) -> tuple[float, float]:
+    rad = math.radians(deg)
+    return math.cos(rad), math.sin(rad)
+
+
+def _rotation(cs: tuple[float, float], dx: float, dy: float) -> QtGui.QTransform:
+    """Verschiebung um (dx, dy), dann Drehung – wie translate().rotate(),
+    aber mit dem im Setter gemerkten (cos, sin)."""
+    c, s = cs
+    return QtGui.QTransform(c, s, -s, c, dx, dy)
+
+
+# Rand um die Modul-Box für update(rect): Antialiasing + Pfeil-Stiftbreite
+_DIRTY_PAD = 2
+
+
+def _dirty_rect(t: QtGui.QTransform, bounds: QtCore.QRectF) -> QtCore.QRect:
+    """Bildschirm-Rechteck, das *bounds* unter *t* überdeckt (mit Rand)."""
+    return t.mapRect(bounds).toAlignedRect().adjusted(
+        -_DIRTY_PAD, -_DIRTY_PAD, _DIRTY_PAD, _DIRTY_PAD)
+
+
+def _composite(bg: QtGui.QPixmap, draw) -> QtGui.QPixmap:
+    """Kopie des Hintergrunds mit den beweglichen Teilen (*draw(p)*, mit
+    Antialiasing) darauf – der Puffer, den paintEvent nur noch blittet."""
+    buf = QtGui.QPixmap(bg)
+    p = QtGui.QPainter(buf)
+    p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    draw(p)
+    p.end()
+    return buf
+
+
+def _wrap_deg(a: float) -> float:
+    """Winkel auf [0, 360). Die Spinboxen liefern fast immer schon Werte
+    im Bereich – dann nur ein Vergleich statt Modulo."""
+    if 0 <= a < 360:
+        return a
+    return a % 360
+
 class TiltWidget(QtWidgets.QFrame):
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._angle        = 0.0   # Grad
+        self._cs = (1.0, 0.0)      # (cos, sin) von -_angle, siehe setAngle
         self._mod_offset   = 0.0   # px
+        self._pivot_offset = 0.0   # px
+        # statischer Hintergrund (Sonne, Wand, Skala) – siehe _background()
+        self._bg_key: tuple[int, int, float] | None = None
+        self._bg_pix: QtGui.QPixmap | None = None
+        # Modul als fertiger Pfad (abgerundetes Rechteck), gültig bis Resize
+        self._mod_path: QtGui.QPainterPath | None = None
+        # fertig komponiertes Bild (Hintergrund + Modul), None = neu aufbauen
+        self._buf: QtGui.QPixmap | None = None
+        self._buf_bg: QtGui.QPixmap | None = None
         self.setMinimumSize(131, 101)
         self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        # Kein WA_OpaquePaintEvent: die Hintergrund-Pixmap ist transparent,
+        # damit der (vom Style gemalte) Seitenhintergrund durchscheint. Qt
+        # löscht vor dem Zeichnen ohnehin nur die per update(rect) gemeldete
+        # Fläche; ein eigenes Füllen entfällt.
+        self.setAutoFillBackground(False)
 
     # -------------------- Public API -----------------------------------
+    # update() wird von Qt ohnehin zu einem paintEvent zusammengefasst;
+    # unveränderte Werte lösen gar keins aus. Neu gezeichnet wird nur die
+    # Fläche des Moduls an alter und neuer Position (Hintergrund = Pixmap).
     def setAngle(self, angle: float) -> None:
-        self._angle = angle % 360
-        self.update()
+        angle = _wrap_deg(angle)
+        if angle != self._angle:
+            old = self._module_rect()
+            self._angle = angle
+            self._cs = _cos_sin(-angle)     # Modul dreht gegen den Uhrzeigersinn
+            self._buf = None
+            self.update(old.united(self._module_rect()))
 
     def setModuleOffset(self, offset_px: float) -> None:
-        self._mod_offset = offset_px
-        self.update()
+        if offset_px != self._mod_offset:
+            old = self._module_rect()
+            self._mod_offset = offset_px
+            self._buf = None
+            self.update(old.united(self._module_rect()))
 
     def setPivotOffset(self, offset_px: float) -> None:
         """Verschiebt die Drehachse vertikal relativ zur Standardposition."""
-        self._pivot_offset = offset_px
-        self.update()
+        if offset_px != self._pivot_offset:
+            self._pivot_offset = offset_px
+            self.update()
 
     # -------------------- Painting -------------------------------------
-    def paintEvent(self, _: QtGui.QPaintEvent) -> None:
-        p = QtGui.QPainter(self)
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._bg_pix = self._buf = None         # Hintergrund neu aufbauen
+        self._mod_path = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.FontChange:
+            self._bg_pix = self._buf = None     # Skalen-Beschriftung neu
+        super().changeEvent(event)
+
+    def _background(self, w: int, h: int) -> QtGui.QPixmap:
+        """Sonne, Wand und Winkelskala hängen nur von der Größe ab und
+        werden einmal in eine Pixmap gezeichnet; paintEvent blittet sie."""
+        dpr = self.devicePixelRatioF()
+        key = (w, h, dpr)
+        if self._bg_pix is not None and self._bg_key == key:
+            return self._bg_pix
+
+        pix = QtGui.QPixmap(round(w * dpr), round(h * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(pix)
         p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        w, h = self.width(), self.height()
-        
+
         # ------------------------------------- Sonne oben links ---------
-        sun_center = QtCore.QPointF(16, 16)
-        sun_r      = 8
-        p.setPen(QtCore.Qt.PenStyle.NoPen)
-        p.setBrush(QtGui.QBrush(CLR_SUN))
-        p.drawEllipse(sun_center, sun_r, sun_r)
-        # Sonnenstrahlen
-        p.setPen(QtGui.QPen(CLR_SUN, 2))
-        for a in range(0, 360, 45):
-            rad = math.radians(a)
-            inner = QtCore.QPointF(
-                sun_center.x() + sun_r * 0.9 * math.cos(rad),
-                sun_center.y() + sun_r * 0.9 * math.sin(rad),
-            )
-            outer = QtCore.QPointF(
-                sun_center.x() + (sun_r + 5) * math.cos(rad),
-                sun_center.y() + (sun_r + 5) * math.sin(rad),
-            )
-            p.drawLine(inner, outer)
+        p.setPen(_NO_PEN)
+        p.setBrush(_BR_SUN)
+        p.drawEllipse(SUN_CENTER, SUN_R, SUN_R)
+        # Sonnenstrahlen (ein Aufruf für alle 8)
+        p.setPen(_PEN_SUN_RAYS)
+        p.drawLines(_SUN_RAYS)
 
-        # Grund‑Pivot (leicht rechts & oben) + user‑Offset
-        pivot_x = w * 0.70
-        pivot_y = h * 0.60
-        p.translate(QtCore.QPointF(pivot_x, pivot_y/2))
+        # Grund‑Pivot (leicht rechts & oben)
+        p.translate(self._pivot(w, h))
 
         # Hauswand
         wall_h = h * 0.60
-        p.setPen(QtGui.QPen(CLR_WALL, 12, QtCore.Qt.PenStyle.SolidLine,
-                            QtCore.Qt.PenCapStyle.SquareCap))
+        p.setPen(_PEN_WALL)
         p.drawLine(QtCore.QPointF(5, wall_h), QtCore.QPointF(5, wall_h - 80))
         
         # ------------------ Winkelskala --------------------------------
         scale_r = w * 0.32   # Radius der Skala
-        p.setPen(QtGui.QPen(CLR_SCALE, 1.5))
-        for deg, label in ((0, "0°"), (45, "45°"), (90, "90°")):
-            p.save()
-            p.rotate(-deg)
-            # Tick‑Marke
-            p.drawLine(QtCore.QPointF(0, 0), QtCore.QPointF(-scale_r, 0))
-            # Text leicht links neben Tick
-            font = p.font(); font.setPointSize(8); p.setFont(font)
-            font.setPointSize(8)
-            font.setWeight(QtGui.QFont.Weight.Bold)
-            p.setFont(font)
-            fm = QtGui.QFontMetricsF(font)
+        p.setPen(_PEN_SCALE)
+        # Tick‑Marken: Endpunkte direkt aus der Tabelle, ein drawLines
+        p.drawLines([QtCore.QLineF(0, 0, -scale_r * c, -scale_r * s)
+                     for _, (c, s) in _SCALE_TICKS])
+        font, fm = _label_font(self.font())     # einmal statt je Tick
+        p.setFont(font)
+        base = p.transform()
+        for label, cs in _SCALE_TICKS:
+            # Text leicht links neben Tick, entlang des Ticks gedreht
+            p.setTransform(_rotation(cs, 0, 0) * base)
             text_pt = QtCore.QPointF(-scale_r - fm.horizontalAdvance(label) - 3,
                                       fm.height()/4)
             p.drawText(text_pt, label)
-            p.restore()
+        p.end()
 
-        # Modul
-        p.rotate(-self._angle)
-        p.translate(0, self._mod_offset)  # Modul‑Versatz nach Rotation
-        mod_len = w * 0.50
-        mod_thk = h * 0.06
-        rect = QtCore.QRectF(-mod_len, -mod_thk, mod_len, mod_thk)
-        p.setPen(QtCore.Qt.PenStyle.NoPen)
-        p.setBrush(QtGui.QBrush(CLR_MODULE))
-        p.drawRoundedRect(rect, 2, 2)
-            
+        self._bg_key, self._bg_pix = key, pix
+        return pix
+
+    @staticmethod
+    def _pivot(w: int, h: int) -> QtCore.QPointF:
+        return QtCore.QPointF(w * 0.70, h * 0.60 / 2)
+
+    def _module_path(self) -> QtGui.QPainterPath:
+        if self._mod_path is None:
+            mod_len = self.width() * 0.50
+            mod_thk = self.height() * 0.06
+            self._mod_path = _rounded_path(
+                QtCore.QRectF(-mod_len, -mod_thk, mod_len, mod_thk))
+        return self._mod_path
+
+    def _module_transform(self) -> QtGui.QTransform:
+        """Pivot → Drehung → Versatz als eine Transformation."""
+        pivot = self._pivot(self.width(), self.height())
+        return (_rotation(self._cs, pivot.x(), pivot.y())
+                .translate(0, self._mod_offset))     # Versatz nach Rotation
+
+    def _module_rect(self) -> QtCore.QRect:
+        return _dirty_rect(self._module_transform(),
+                           self._module_path().boundingRect())
+
+    def _draw_module(self, p: QtGui.QPainter) -> None:
+        p.setTransform(self._module_transform())
+        p.setPen(_NO_PEN)
+        p.setBrush(_BR_MODULE)
+        p.drawPath(self._module_path())
+
+    def paintEvent(self, _: QtGui.QPaintEvent) -> None:
+        # Puffer nur nach Wertänderung/Resize neu komponieren; Expose-
+        # und Eltern-Repaints blitten nur noch
+        bg = self._background(self.width(), self.height())
+        if self._buf is None or self._buf_bg is not bg:
+            self._buf, self._buf_bg = _composite(bg, self._draw_module), bg
+        p = QtGui.QPainter(self)
+        p.drawPixmap(0, 0, self._buf)
         p.end()
 
 
@@ -107,67 +260,153 @@ class AzimuthWidget(QtWidgets.QFrame):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._azimuth = 0.0
+        self._cs = (1.0, 0.0)      # (cos, sin) von _azimuth, siehe setAzimuth
+        self._label: tuple[QtGui.QFont, QtGui.QFontMetricsF] | None = None
+        # Textpositionen N/E/S/W – gültig bis Resize/FontChange
+        self._label_pts: list[tuple[QtCore.QPointF, str]] | None = None
+        # Pfeil (Schaft, Spitze) – hängt nur vom Radius ab, gültig bis Resize
+        self._arrow: tuple[QtCore.QLineF, QtGui.QPolygonF] | None = None
+        self._mod_path: QtGui.QPainterPath | None = None
+        # ungedrehte Box um Modul + Pfeil (für update(rect)), gültig bis Resize
+        self._rot_bounds: QtCore.QRectF | None = None
+        # statischer Hintergrund (Kreis, Himmelsrichtungen) – siehe _background()
+        self._bg_key: tuple[int, int, float] | None = None
+        self._bg_pix: QtGui.QPixmap | None = None
+        # fertig komponiertes Bild (Hintergrund + Modul/Pfeil), siehe TiltWidget
+        self._buf: QtGui.QPixmap | None = None
+        self._buf_bg: QtGui.QPixmap | None = None
         self.setMinimumSize(121, 121)
         self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.setAutoFillBackground(False)       # siehe TiltWidget
 
     # -------------------- Public API -----------------------------------
     def setAzimuth(self, az_deg: float) -> None:
-        self._azimuth = az_deg % 360
-        self.update()
+        az_deg = _wrap_deg(az_deg)
+        if az_deg != self._azimuth:
+            # nur Modul + Pfeil an alter und neuer Position neu zeichnen
+            old = self._rotated_rect()
+            self._azimuth = az_deg
+            self._cs = _cos_sin(az_deg)
+            self._buf = None
+            self.update(old.united(self._rotated_rect()))
 
     # -------------------- Painting -------------------------------------
-    def paintEvent(self, _: QtGui.QPaintEvent) -> None:
-        p = QtGui.QPainter(self)
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._label_pts = self._arrow = self._mod_path = self._rot_bounds = None
+        self._bg_pix = self._buf = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.FontChange:
+            self._label = self._label_pts = self._bg_pix = self._buf = None
+        super().changeEvent(event)
+
+    def _compass_labels(self, radius: float) -> list[tuple[QtCore.QPointF, str]]:
+        """(Position, Text) der vier Himmelsrichtungen, einmal je Größe/Font."""
+        if self._label_pts is None:
+            _, fm = self._label
+            htx = fm.height()
+            dist = radius + 8
+            self._label_pts = [
+                (QtCore.QPointF(ux * dist - fm.horizontalAdvance(t)/2,
+                                uy * dist + htx/4), t)
+                for t, ux, uy in _COMPASS_LABELS
+            ]
+        return self._label_pts
+
+    def _pivot(self) -> tuple[float, float]:
+        return self.width() * 0.50, self.height() * 0.55
+
+    def _radius(self) -> float:
+        return min(self.width(), self.height()) * 0.30
+
+    def _module_path(self) -> QtGui.QPainterPath:
+        if self._mod_path is None:
+            radius = self._radius()
+            mod_w, mod_h = radius * 0.85, radius * 0.16
+            self._mod_path = _rounded_path(
+                QtCore.QRectF(-mod_w/2, -mod_h/2, mod_w, mod_h))
+        return self._mod_path
+
+    def _rotated_rect(self) -> QtCore.QRect:
+        """Bildschirmfläche von Modul + Pfeil beim aktuellen Azimut."""
+        if self._rot_bounds is None:
+            shaft, head = self._arrow_shape()
+            self._rot_bounds = (self._module_path().boundingRect()
+                                .united(head.boundingRect())
+                                .united(QtCore.QRectF(shaft.p1(), shaft.p2())
+                                        .normalized()))
+        return _dirty_rect(_rotation(self._cs, *self._pivot()), self._rot_bounds)
+
+    def _arrow_shape(self) -> tuple[QtCore.QLineF, QtGui.QPolygonF]:
+        if self._arrow is None:
+            radius = self._radius()
+            self._arrow = (
+                QtCore.QLineF(0, 0, 0, -radius + 6),
+                QtGui.QPolygonF([
+                    QtCore.QPointF(0, -radius + 6),
+                    QtCore.QPointF(-4, -radius + 14),
+                    QtCore.QPointF(4, -radius + 14),
+                ]),
+            )
+        return self._arrow
+
+    def _background(self, w: int, h: int) -> QtGui.QPixmap:
+        """Kreis und Himmelsrichtungen hängen nur von Größe und Font ab –
+        einmal (mit Antialiasing) in eine Pixmap, paintEvent blittet sie."""
+        dpr = self.devicePixelRatioF()
+        key = (w, h, dpr)
+        if self._bg_pix is not None and self._bg_key == key:
+            return self._bg_pix
+
+        pix = QtGui.QPixmap(round(w * dpr), round(h * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+        p = QtGui.QPainter(pix)
         p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        w, h = self.width(), self.height()
-        # Grund‑Pivot (leicht rechts & oben) + user‑Offset
-        pivot_x = w * 0.50
-        pivot_y = h * 0.55
+        # Grund‑Pivot (leicht rechts & oben)
+        pivot_x, pivot_y = self._pivot()
         p.translate(QtCore.QPointF(pivot_x, pivot_y))
 
-        radius = min(w, h) * 0.30
+        radius = self._radius()
 
         # Kreis
-        p.setPen(QtGui.QPen(CLR_WALL, 2))
-        p.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        p.setPen(_PEN_CIRCLE)
+        p.setBrush(_NO_BRUSH)
         p.drawEllipse(QtCore.QPointF(0, 0), radius, radius)
 
         # Labels
-        font = p.font()
-        font.setPointSize(8)
-        font.setWeight(QtGui.QFont.Weight.Bold)
-        p.setFont(font)
+        if self._label is None:
+            self._label = _label_font(self.font())
+        p.setFont(self._label[0])
         p.setPen(QtCore.Qt.GlobalColor.black)
-        fm  = QtGui.QFontMetricsF(font)
-        htx = fm.height()
-        def _lbl(t, dx, dy):
-            bw = fm.horizontalAdvance(t)
-            p.drawText(QtCore.QPointF(dx - bw/2, dy + htx/4), t)
-        _lbl("N", 0, -radius - 8)
-        _lbl("E", radius + 8, 0)
-        _lbl("S", 0, radius + 8)
-        _lbl("W", -radius - 8, 0)
+        for pt, t in self._compass_labels(radius):
+            p.drawText(pt, t)
+        p.end()
+
+        self._bg_key, self._bg_pix = key, pix
+        return pix
+
+    def paintEvent(self, _: QtGui.QPaintEvent) -> None:
+        bg = self._background(self.width(), self.height())
+        if self._buf is None or self._buf_bg is not bg:
+            self._buf, self._buf_bg = _composite(bg, self._draw_rotating), bg
+        p = QtGui.QPainter(self)
+        p.drawPixmap(0, 0, self._buf)
+        p.end()
+
+    def _draw_rotating(self, p: QtGui.QPainter) -> None:
+        # Modul und Pfeil teilen sich dieselbe Drehung
+        p.setTransform(_rotation(self._cs, *self._pivot()))
 
         # Modul
-        p.save()
-        p.rotate(self._azimuth)
-        mod_w, mod_h = radius * 0.85, radius * 0.16
-        p.setPen(QtCore.Qt.PenStyle.NoPen)
-        p.setBrush(QtGui.QBrush(CLR_MODULE))
-        p.drawRoundedRect(QtCore.QRectF(-mod_w/2, -mod_h/2, mod_w, mod_h), 2, 2)
-        p.restore()
+        p.setPen(_NO_PEN)
+        p.setBrush(_BR_MODULE)
+        p.drawPath(self._module_path())
 
         # Pfeil
-        p.save()
-        p.rotate(self._azimuth)
-        p.setPen(QtGui.QPen(CLR_ARROW, 2))
-        p.drawLine(QtCore.QPointF(0, 0), QtCore.QPointF(0, -radius + 6))
-        head = QtGui.QPolygonF([
-            QtCore.QPointF(0, -radius + 6),
-            QtCore.QPointF(-4, -radius + 14),
-            QtCore.QPointF(4, -radius + 14),
-        ])
-        p.setBrush(QtGui.QBrush(CLR_ARROW))
+        shaft, head = self._arrow_shape()
+        p.setPen(_PEN_ARROW)
+        p.drawLine(shaft)
+        p.setBrush(_BR_ARROW)
         p.drawPolygon(head)
-        p.restore()
-        p.end()
@@ -17,19 +17,36 @@
 from __future__ import annotations
 
 import calendar
+import importlib.util
 import json
 import math
 import os
 import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-import pvlib 
-from pvlib.iotools import get_pvgis_hourly
-from pvlib import atmosphere, irradiance, iam
+
+
+def _lazy_import(name: str):
+    """Registriert *name* in sys.modules, führt das Modul aber erst beim ersten
+    Attributzugriff aus (importlib.util.LazyLoader). pandas/pvlib werden so
+    erst bei der ersten Berechnung geladen statt beim GUI-Start."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+pd    = _lazy_import("pandas")
+pvlib = _lazy_import("pvlib")
 
 from bkwsimx import __version__
 
@@ -226,12 +243,22 @@ class Settings:
 # Datenbanken laden
 # ---------------------------------------------------------------------------
 
-with open(_resource_path("resources\\pv_systems.json"), "r", encoding="utf-8") as f:
-    _pv_systems = json.load(f)
-with open(_resource_path("resources\\inverters.json"), "r", encoding="utf-8") as f:
-    _inverters = json.load(f)
-with open(_resource_path("resources\\batteries.json"), "r", encoding="utf-8") as f:
-    _batteries = json.load(f)
+def _load_databases() -> tuple[list, list, list]:
+    """PV-Systeme, Wechselrichter und Speicher laden."""
+    if getattr(sys, "frozen", False):
+        # cx_Freeze-EXE: beim Build erzeugtes Modul mit Python-Literalen (setup.py)
+        try:
+            from resources._data import PV_SYSTEMS, INVERTERS, BATTERIES
+            return PV_SYSTEMS, INVERTERS, BATTERIES
+        except ImportError:
+            pass            # PyInstaller-Bundle (main.spec) enthält nur die JSON-Dateien
+    dbs = []
+    for name in ("pv_systems", "inverters", "batteries"):
+        with open(_resource_path(f"resources\\{name}.json"), "r", encoding="utf-8") as f:
+            dbs.append(json.load(f))
+    return tuple(dbs)
+
+_pv_systems, _inverters, _batteries = _load_databases()
 
 _sys_by_name   = {s["name"]: s for s in _pv_systems}
 _inv_by_model  = {i["model"]: i for i in _inverters}
@@ -239,6 +266,14 @@ _batt_by_model = {b["model"]: b for b in _batteries}
 _inv_by_id     = {i["id"]:    i for i in _inverters}
 _batt_by_id    = {b["id"]:    b for b in _batteries}
 
+# Systeme je Hersteller (Reihenfolge wie in der Datenbank) + sortierte Namen
+_sys_by_manufacturer: dict[str, list[dict]] = defaultdict(list)
+for _s in _pv_systems:
+    if _s.get("manufacturer"):
+        _sys_by_manufacturer[_s["manufacturer"]].append(_s)
+_sys_by_manufacturer = dict(_sys_by_manufacturer)
+MANUFACTURERS: tuple[str, ...] = tuple(sorted(_sys_by_manufacturer))
+
 # ---------------------------------------------------------------------------
 # Hilfsroutinen
 # ---------------------------------------------------------------------------
@@ -288,7 +323,7 @@ def _get_pvgis_cached(latitude: float, longitude: float,
 
     if key not in _PVGIS_CACHE:
         #logger.debug("PVGIS: lade Wetterdaten neu für %s", key)
-        df, *_ = get_pvgis_hourly(
+        df, *_ = pvlib.iotools.get_pvgis_hourly(
             latitude=latitude, longitude=longitude,
             start=start_year, end=end_year,
             map_variables=True,
@@ -475,9 +510,9 @@ def run_calculation(settings: Settings, *, progress: Optional[Callable[[int], No
             ghi             = ghi_input,
         )
         poa_ref      = irr_ref["poa_global"]
-        aoi_ref      = irradiance.aoi(mp.tilt_deg, mp.azimuth_deg,
+        aoi_ref      = pvlib.irradiance.aoi(mp.tilt_deg, mp.azimuth_deg,
                                       solpos["zenith"], solpos["azimuth"])
-        iam_fac_ref  = iam.ashrae(aoi_ref, b=0.035)
+        iam_fac_ref  = pvlib.iam.ashrae(aoi_ref, b=0.035)
         poa_eff_ref  = poa_ref * iam_fac_ref
 
         dc_noshade_i = pvlib.pvsystem.pvwatts_dc(
@@ -506,9 +541,9 @@ def run_calculation(settings: Settings, *, progress: Optional[Callable[[int], No
             ghi             = ghi_input,
         )
         poa      = irr["poa_global"]
-        aoi      = irradiance.aoi(mp.tilt_deg, mp.azimuth_deg,
+        aoi      = pvlib.irradiance.aoi(mp.tilt_deg, mp.azimuth_deg,
                                   solpos["zenith"], solpos["azimuth"])
-        iam_fac  = iam.ashrae(aoi, b=0.035)
+        iam_fac  = pvlib.iam.ashrae(aoi, b=0.035)
         poa_eff  = poa * iam_fac
         poa_eff_list.append(poa_eff)
 
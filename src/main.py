@@ -99,17 +99,6 @@ def _excepthook(exc_type, exc_value, exc_tb):
 
 sys.excepthook = _excepthook
 
-# ---------------------------------------------------------------------------#
-# Ressourcen‑Pfad für cx_Freeze                                              #
-# ---------------------------------------------------------------------------#
-
-def _resource_path(rel: str) -> str:
-    base = Path(getattr(sys, "_MEIPASS", APP_DIR))
-    for cand in (base / rel, base / "lib" / rel):
-        if cand.exists():
-            return str(cand)
-    raise FileNotFoundError(rel)
-
 # ---------------------------------------------------------------------------#
 # User‑Profil & Default‑Konfiguration                                        #
 # ---------------------------------------------------------------------------#
@@ -148,6 +137,9 @@ def main() -> None:
     from PyQt6.QtWidgets import QStyleFactory
 
     logger.info(f"BKWSimX {__version__} startet …")
+    # QtWebEngine wird erst im MainWindow importiert – dafür muss das
+    # OpenGL-Context-Sharing vor dem Anlegen der QApplication gesetzt sein.
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QtWidgets.QApplication(sys.argv)
 
     # Debug‑Ausgabe des aktuellen DPI‑Modus (entfernbar)
@@ -158,8 +150,11 @@ def main() -> None:
         logger.debug("DPI‑Awareness (0=UA,1=SA,2=PM,3=PMv2): %s", awareness.value)
         logger.debug("Qt logical DPI: %s", app.primaryScreen().logicalDotsPerInch())
 
-    # Splash‑Screen
-    pix = QtGui.QPixmap(_resource_path("icons/splash.png")).scaled(
+    # Splash‑Screen (aus library.zip bzw. src/icons)
+    from resources import read_bytes
+    pix = QtGui.QPixmap()
+    pix.loadFromData(read_bytes("icons/splash.png"))
+    pix = pix.scaled(
         400, 400, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
         QtCore.Qt.TransformationMode.SmoothTransformation,
     )
@@ -0,0 +1,32 @@
+"""Zugriff auf mitgelieferte Binär-Ressourcen (Icons, Splash-Screen, Leaflet).
+
+In der cx_Freeze-EXE liegen die Dateien per `zip_includes` in library.zip
+unter `resources/…` und werden ohne eigene Datei-Öffnungen über
+`importlib.resources` gelesen. Im Quellbaum bzw. im PyInstaller-Bundle wird
+auf das Dateisystem (Basisverzeichnis bzw. »lib/«) zurückgegriffen.
+"""
+from __future__ import annotations
+
+import functools
+import sys
+from importlib.resources import files
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=None)
+def _locate(rel: str):
+    """Sucht *rel* einmal (Paket, Basisverzeichnis, »lib/«) und merkt sich
+    den Treffer – weitere Zugriffe kosten keine stat()-Aufrufe mehr."""
+    res = files(__name__).joinpath(rel)
+    if res.is_file():
+        return res
+    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent))
+    for cand in (base / rel, base / "lib" / rel):
+        if cand.exists():
+            return cand
+    raise FileNotFoundError(rel)
+
+
+def read_bytes(rel: str) -> bytes:
+    """Liefert den Inhalt der Ressource *rel* (z. B. ``"icons/icon.ico"``)."""
+    return _locate(rel).read_bytes()